@@ -10,6 +10,13 @@ import argparse
 from pathlib import Path
 import sys
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
 # Agregar src al path
 backend_path = Path(__file__).parent.parent
 src_path = backend_path / "src"
@@ -18,6 +25,13 @@ sys.path.insert(0, str(src_path))
 from src.utils.data_generator import DataGenerator
 
 
+def _to_builtin(obj):
+    """Convierte columnas NumPy a tipos serializables por json"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Objeto no serializable: {type(obj).__name__}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Genera datos simulados de interacciones gestuales"
@@ -50,41 +64,45 @@ def main():
     print(f"  • Tipo: {args.type}")
     print(f"  • Cantidad: {args.num}")
 
-    # Generar datos según tipo
+    # Generar datos según tipo, en formato columnar (una lista por campo)
     if args.type == "random":
-        interactions = DataGenerator.generate_random_interactions(
+        columns = DataGenerator.generate_random_columns(
             num_interactions=args.num
         )
     elif args.type == "realistic":
-        interactions = DataGenerator.generate_realistic_sequence()
+        columns = DataGenerator.to_columns(
+            DataGenerator.generate_realistic_sequence()
+        )
     else:  # community
-        interactions = DataGenerator.generate_community_based()
+        columns = DataGenerator.to_columns(
+            DataGenerator.generate_community_based()
+        )
+
+    num_interactions = len(columns["from_node"])
 
-    # Convertir a dict
     data = {
         "session_id": "simulated_session",
-        "num_interactions": len(interactions),
-        "interactions": [
-            {
-                "from_node": i.from_node,
-                "to_node": i.to_node,
-                "timestamp": i.timestamp,
-                "duration": i.duration,
-                "session_id": i.session_id
-            }
-            for i in interactions
-        ]
+        "num_interactions": num_interactions,
+        "interactions": columns
     }
 
     # Guardar
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=_to_builtin,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=_to_builtin)
 
     print(f"\n✅ Datos guardados en: {output_path}")
-    print(f"  • Total de interacciones: {len(interactions)}")
+    print(f"  • Total de interacciones: {num_interactions}")
 
 
 if __name__ == "__main__":
@@ -5,10 +5,16 @@ Opciones:
 1. python main.py api - Iniciar API REST
 2. python main.py demo - Ejecutar demo de análisis de grafos
 3. python main.py camera - Ejecutar detección de gestos con cámara
+
+Cada modo importa sus dependencias (FastAPI, NetworkX, OpenCV, MediaPipe)
+solo al ejecutarse, para no pagar su tiempo de carga en los demás modos.
 """
 
 import sys
 import argparse
+import heapq
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 # Agregar src al path
@@ -16,26 +22,36 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 
-def run_api():
-    """Inicia el servidor API REST"""
+def run_api(dev: bool = False, workers: int = 1):
+    """
+    Inicia el servidor API REST
+
+    Args:
+        dev: Modo desarrollo (recarga automática, un solo worker)
+        workers: Número de procesos worker. Las sesiones se guardan en
+            memoria, por lo que cada worker tiene su propio almacenamiento.
+    """
     import uvicorn
-    from src.api.main import app
 
     print("🚀 Iniciando DOCommunication API...")
     print("📖 Documentación: http://localhost:8000/docs")
     print("🔍 Health check: http://localhost:8000/health")
 
+    # uvloop/httptools se usan automáticamente si están instalados
     uvicorn.run(
-        app,
+        "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=dev,
+        workers=1 if dev else workers,
+        loop="auto",
+        http="auto"
     )
 
 
 def run_demo():
     """Ejecuta demo de análisis de grafos"""
-    from src.graph.analyzer import InteractionGraphAnalyzer
+    from src.graph.analyzer import InteractionGraphAnalyzer, METRIC_GROUPS
     from src.utils.data_generator import DataGenerator
 
     print("🎮 Demo: Análisis de Grafos de Interacciones\n")
@@ -54,7 +70,7 @@ def run_demo():
 
     # Calcular métricas
     print("📈 Calculando métricas del grafo...")
-    metrics = analyzer.compute_all_metrics()
+    metrics = analyzer.compute_all_metrics(include=METRIC_GROUPS)
 
     print("\n" + "="*60)
     print("MÉTRICAS DEL GRAFO")
@@ -73,20 +89,20 @@ def run_demo():
     print(f"  • Modularidad: {metrics.modularity_score:.3f}")
 
     print(f"\n🎯 Top 3 Nodos por PageRank:")
-    top_pagerank = sorted(
+    top_pagerank = heapq.nlargest(
+        3,
         metrics.node_metrics,
-        key=lambda x: x.pagerank,
-        reverse=True
-    )[:3]
+        key=lambda x: x.pagerank
+    )
     for i, node in enumerate(top_pagerank, 1):
         print(f"  {i}. {node.node_id}: {node.pagerank:.3f}")
 
     print(f"\n🎯 Top 3 Nodos por Betweenness:")
-    top_betweenness = sorted(
+    top_betweenness = heapq.nlargest(
+        3,
         metrics.node_metrics,
-        key=lambda x: x.betweenness_centrality,
-        reverse=True
-    )[:3]
+        key=lambda x: x.betweenness_centrality
+    )
     for i, node in enumerate(top_betweenness, 1):
         print(f"  {i}. {node.node_id}: {node.betweenness_centrality:.3f}")
 
@@ -115,8 +131,156 @@ def run_demo():
     print("\n✅ Demo completado!")
 
 
+# Detección de movimiento sobre una miniatura en gris: hay movimiento si
+# cambia una fracción mínima de píxeles (un gesto pequeño no mueve la media)
+MOTION_PIXEL_THRESHOLD = 12
+MOTION_CHANGED_FRACTION = 0.002
+MOTION_THUMBNAIL_SIZE = (64, 48)
+MOTION_MIN_CHANGED_PIXELS = max(
+    1, int(MOTION_THUMBNAIL_SIZE[0] * MOTION_THUMBNAIL_SIZE[1] * MOTION_CHANGED_FRACTION)
+)
+# Se reprocesa igualmente tras este número de frames omitidos seguidos
+MOTION_MAX_SKIPPED_FRAMES = 15
+
+
+@lru_cache(maxsize=4096)
+def _format_angle(label: str, angle: float) -> str:
+    """Texto del ángulo, cacheado por ángulo redondeado a 0.1° (0-180° por brazo)"""
+    return f"{label} Angle: {angle:.1f}°"
+
+
+class _LatestSlot:
+    """
+    Buffer de un solo elemento compartido entre hilos
+
+    El productor sobrescribe el elemento; el consumidor siempre obtiene
+    el más reciente, descartando los que no alcanzó a procesar.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._item = None
+        self._version = 0
+
+    def put(self, item):
+        with self._condition:
+            self._item = item
+            self._version += 1
+            self._condition.notify_all()
+
+    def get(self):
+        with self._condition:
+            return self._item, self._version
+
+    def wait_newer(self, version: int, timeout: float = 0.1):
+        """Espera un elemento más nuevo que `version` (None si expira)"""
+        with self._condition:
+            if self._version == version:
+                self._condition.wait(timeout)
+            if self._version == version:
+                return None
+            return self._item, self._version
+
+
+@lru_cache(maxsize=4096)
+def _text_tile(text: str, font_scale: float, color: tuple, thickness: int):
+    """
+    Rasteriza un texto una sola vez
+
+    Returns:
+        Tupla (tile BGR, opacidad por píxel, altura sobre la línea base)
+    """
+    import cv2
+    import numpy as np
+
+    (width, height), baseline = cv2.getTextSize(
+        text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
+    )
+    tile = np.zeros((height + baseline + thickness, width + thickness, 3), dtype=np.uint8)
+    cv2.putText(
+        tile,
+        text,
+        (0, height),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        font_scale,
+        color,
+        thickness
+    )
+    # Opacidad de cada píxel (los bordes suavizados son parcialmente opacos)
+    alpha = tile.max(axis=2, keepdims=True).astype(np.float32) / max(max(color), 1)
+
+    return tile.astype(np.float32), alpha, height
+
+
+def _blit_text(frame, text: str, origin: tuple, font_scale: float,
+               color: tuple, thickness: int):
+    """Mezcla el texto pre-rasterizado sobre el frame (origen en la línea base, como cv2.putText)"""
+    tile, alpha, height = _text_tile(text, font_scale, color, thickness)
+
+    x, y = origin[0], origin[1] - height
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + tile.shape[1], frame.shape[1])
+    y1 = min(y + tile.shape[0], frame.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    tile = tile[y0 - y:y1 - y, x0 - x:x1 - x]
+    alpha = alpha[y0 - y:y1 - y, x0 - x:x1 - x]
+    roi = frame[y0:y1, x0:x1]
+    roi[:] = roi * (1.0 - alpha) + tile
+
+
+def _draw_gesture_status(annotated_frame, gesture_state, status_text):
+    """Dibuja el estado de gestos y los ángulos sobre el frame anotado"""
+    # Mostrar estado de gestos
+    num_status = 0
+
+    if gesture_state.left_arm_l:
+        status_text[num_status] = "✅ Brazo IZQ en L"
+        num_status += 1
+    if gesture_state.right_arm_l:
+        status_text[num_status] = "✅ Brazo DER en L"
+        num_status += 1
+    if gesture_state.thumbs_up:
+        status_text[num_status] = "👍 Thumbs Up"
+        num_status += 1
+
+    # Dibujar texto en frame
+    y_offset = 30
+    for text in status_text[:num_status]:
+        _blit_text(annotated_frame, text, (10, y_offset), 0.7, (0, 255, 0), 2)
+        y_offset += 35
+
+    # Mostrar ángulos
+    if gesture_state.left_angle:
+        _blit_text(
+            annotated_frame,
+            _format_angle("L", round(gesture_state.left_angle, 1)),
+            (10, annotated_frame.shape[0] - 60),
+            0.6,
+            (255, 255, 255),
+            2
+        )
+
+    if gesture_state.right_angle:
+        _blit_text(
+            annotated_frame,
+            _format_angle("R", round(gesture_state.right_angle, 1)),
+            (10, annotated_frame.shape[0] - 30),
+            0.6,
+            (255, 255, 255),
+            2
+        )
+
+
 def run_camera():
-    """Ejecuta detección de gestos en tiempo real con cámara"""
+    """
+    Ejecuta detección de gestos en tiempo real con cámara
+
+    La captura, la inferencia y la visualización corren en hilos
+    separados, de modo que la ventana se actualiza al ritmo de la cámara
+    aunque MediaPipe tarde más por frame.
+    """
     import cv2
     from src.vision.detector import GestureDetector
 
@@ -127,84 +291,99 @@ def run_camera():
     print()
 
     # Inicializar cámara
-    cap = cv2.VideoCapture(0)
+    if sys.platform == "win32":
+        cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+    else:
+        cap = cv2.VideoCapture(0)
 
     if not cap.isOpened():
         print("❌ Error: No se pudo abrir la cámara")
         return
 
+    # Evitar frames atrasados en el buffer del driver
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
     # Inicializar detector
     detector = GestureDetector()
 
     print("✅ Cámara iniciada. Presiona ESC para salir.\n")
 
-    try:
-        while True:
+    latest_frame = _LatestSlot()
+    latest_annotated = _LatestSlot()
+    stop = threading.Event()
+
+    def capture_loop():
+        """Lee frames de la cámara y publica siempre el más reciente"""
+        while not stop.is_set():
             ret, frame = cap.read()
 
             if not ret:
                 print("❌ Error al leer frame")
+                stop.set()
                 break
 
-            # Procesar frame
-            annotated_frame, landmark_data, gesture_state = detector.process_frame(frame)
-
-            # Mostrar estado de gestos
-            status_text = []
-
-            if gesture_state.left_arm_l:
-                status_text.append("✅ Brazo IZQ en L")
-            if gesture_state.right_arm_l:
-                status_text.append("✅ Brazo DER en L")
-            if gesture_state.thumbs_up:
-                status_text.append("👍 Thumbs Up")
-
-            # Dibujar texto en frame
-            y_offset = 30
-            for text in status_text:
-                cv2.putText(
-                    annotated_frame,
-                    text,
-                    (10, y_offset),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
-                    2
-                )
-                y_offset += 35
-
-            # Mostrar ángulos
-            if gesture_state.left_angle:
-                cv2.putText(
-                    annotated_frame,
-                    f"L Angle: {gesture_state.left_angle:.1f}°",
-                    (10, annotated_frame.shape[0] - 60),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (255, 255, 255),
-                    2
+            latest_frame.put(frame)
+
+    def inference_loop():
+        """Procesa el frame más reciente y publica el frame anotado"""
+        # Buffers reutilizados entre frames
+        status_text = [None] * 3
+        prev_thumbnail = None
+        skipped = 0
+        version = 0
+
+        while not stop.is_set():
+            newer = latest_frame.wait_newer(version)
+            if newer is None:
+                continue
+            frame, version = newer
+
+            # Solo reprocesar si la escena cambió respecto al último frame procesado
+            thumbnail = cv2.resize(
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+                MOTION_THUMBNAIL_SIZE,
+                interpolation=cv2.INTER_AREA
+            )
+            if prev_thumbnail is not None and skipped < MOTION_MAX_SKIPPED_FRAMES:
+                _, changed = cv2.threshold(
+                    cv2.absdiff(thumbnail, prev_thumbnail),
+                    MOTION_PIXEL_THRESHOLD, 255, cv2.THRESH_BINARY
                 )
+                if cv2.countNonZero(changed) < MOTION_MIN_CHANGED_PIXELS:
+                    skipped += 1
+                    continue
+            prev_thumbnail = thumbnail
+            skipped = 0
+
+            # Procesar frame (cada cap.read() entrega un array nuevo: se anota in-place)
+            annotated_frame, landmark_data, gesture_state = detector.process_frame_annotated(
+                frame, in_place=True
+            )
+            _draw_gesture_status(annotated_frame, gesture_state, status_text)
+
+            latest_annotated.put(annotated_frame)
+
+    threads = [
+        threading.Thread(target=capture_loop, name="camera-capture", daemon=True),
+        threading.Thread(target=inference_loop, name="gesture-inference", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
 
-            if gesture_state.right_angle:
-                cv2.putText(
-                    annotated_frame,
-                    f"R Angle: {gesture_state.right_angle:.1f}°",
-                    (10, annotated_frame.shape[0] - 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (255, 255, 255),
-                    2
-                )
+    try:
+        while not stop.is_set():
+            annotated_frame, _ = latest_annotated.get()
 
             # Mostrar frame
-            cv2.imshow('DOCommunication - Gesture Detection', annotated_frame)
+            if annotated_frame is not None:
+                cv2.imshow('DOCommunication - Gesture Detection', annotated_frame)
 
             # Manejar teclas
             key = cv2.waitKey(1) & 0xFF
 
             if key == 27:  # ESC
                 break
-            elif key == 32:  # ESPACIO
+            elif key == 32 and annotated_frame is not None:  # ESPACIO
                 # Guardar captura
                 capture_path = Path(__file__).parent / "visualizations" / "capture.png"
                 capture_path.parent.mkdir(exist_ok=True)
@@ -212,6 +391,9 @@ def run_camera():
                 print(f"📸 Captura guardada: {capture_path}")
 
     finally:
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=2.0)
         cap.release()
         cv2.destroyAllWindows()
         detector.close()
@@ -230,6 +412,19 @@ def main():
         help="Modo de ejecución: api (servidor REST), demo (análisis de grafos), camera (detección en tiempo real)"
     )
 
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Modo desarrollo para la API (recarga automática al editar código)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Número de workers de la API (las sesiones en memoria no se comparten entre workers)"
+    )
+
     args = parser.parse_args()
 
     print("="*60)
@@ -239,7 +434,7 @@ def main():
     print()
 
     if args.mode == "api":
-        run_api()
+        run_api(dev=args.dev, workers=args.workers)
     elif args.mode == "demo":
         run_demo()
     elif args.mode == "camera":
@@ -5,24 +5,33 @@ Endpoints:
 - POST /api/sessions - Crear nueva sesión
 - POST /api/sessions/{session_id}/interactions - Agregar interacción
 - GET /api/sessions/{session_id}/metrics - Obtener métricas del grafo
+- WS /api/sessions/{session_id}/metrics/stream - Cambios del grafo en tiempo real
 - GET /api/sessions/{session_id} - Obtener sesión completa
 - GET /api/sessions - Listar todas las sesiones
 """
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import time
 import uuid
 
+import orjson
+
 from ..models.session import Session, InteractionRecord, GraphMetrics
-from ..graph.analyzer import InteractionGraphAnalyzer
+from ..graph.analyzer import InteractionGraphAnalyzer, DEFAULT_METRIC_GROUPS
+from .store import LRUSessionStore
 
 # Crear aplicación FastAPI
 app = FastAPI(
     title="DOCommunication Backend API",
     description="API para análisis de grafos de comunicación gestual UCI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configurar CORS para permitir conexión desde Netlify
@@ -31,17 +40,75 @@ app.add_middleware(
     allow_origins=[
         "http://localhost:5173",
         "http://localhost:3000",
-        "https://*.netlify.app",  # Permitir todos los subdominios de Netlify
     ],
+    # allow_origins no admite comodines: los subdominios de Netlify van por regex
+    allow_origin_regex=r"^https://([a-z0-9-]+\.)?netlify\.app$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Número máximo de sesiones en memoria (se desalojan las menos usadas)
+MAX_SESSIONS = 1024
+
+
+# Tamaño máximo de la cola de cambios por cliente WebSocket
+STREAM_QUEUE_SIZE = 256
+
+
+def _evict_session(session_id: str):
+    """Libera los recursos asociados a una sesión desalojada"""
+    analyzers_db.pop(session_id, None)
+    metrics_cache.pop(session_id, None)
+    metrics_locks.pop(session_id, None)
+    session_summaries.pop(session_id, None)
+    _publish(session_id, None)
+    metrics_subscribers.pop(session_id, None)
+
+
+def _publish(session_id: str, delta: Optional[Dict]):
+    """
+    Envía un cambio a los clientes suscritos a una sesión
+
+    Args:
+        session_id: ID de la sesión
+        delta: Cambio a enviar, o None para cerrar los streams
+    """
+    for queue in metrics_subscribers.get(session_id, []):
+        try:
+            queue.put_nowait(delta)
+        except asyncio.QueueFull:
+            # Cliente lento: se descarta el cambio en lugar de bloquear,
+            # salvo la señal de cierre, que reemplaza a los cambios pendientes
+            if delta is None:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
 # Storage en memoria (en producción usar base de datos)
-sessions_db: Dict[str, Session] = {}
+sessions_db: LRUSessionStore = LRUSessionStore(
+    max_sessions=MAX_SESSIONS,
+    on_evict=_evict_session
+)
 analyzers_db: Dict[str, InteractionGraphAnalyzer] = {}
 
+# Cache de métricas por sesión: (num_interactions, métricas calculadas)
+metrics_cache: Dict[str, Tuple[Tuple[int, frozenset], GraphMetrics]] = {}
+metrics_locks: Dict[str, asyncio.Lock] = {}
+
+# Colas de clientes WebSocket suscritos a cada sesión
+metrics_subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+# Resumen de cada sesión para list_sessions, actualizado en cada cambio
+session_summaries: Dict[str, Dict] = {}
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """Timestamp ISO 8601 con resolución de segundos (cacheado por segundo)"""
+    return datetime.fromtimestamp(second).isoformat()
+
 
 @app.get("/")
 async def root():
@@ -58,7 +125,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _iso_timestamp(int(time.time()))
     }
 
 
@@ -81,10 +148,19 @@ async def create_session() -> Dict:
 
     sessions_db[session_id] = session
     analyzers_db[session_id] = InteractionGraphAnalyzer()
+    metrics_locks[session_id] = asyncio.Lock()
+    session_summaries[session_id] = {
+        "session_id": session_id,
+        "start_time": session.start_time_iso,
+        "end_time": None,
+        "num_interactions": 0,
+        "num_selections": 0,
+        "duration_seconds": None
+    }
 
     return {
         "session_id": session_id,
-        "start_time": session.start_time.isoformat()
+        "start_time": session.start_time_iso
     }
 
 
@@ -110,13 +186,32 @@ async def add_interaction(
         )
 
     # Agregar a sesión
-    session = sessions_db[session_id]
+    session = sessions_db.touch(session_id)
     session.interactions.append(interaction)
 
     # Agregar al analizador de grafos
     analyzer = analyzers_db[session_id]
     analyzer.add_interaction(interaction)
 
+    # Invalidar métricas cacheadas
+    metrics_cache.pop(session_id, None)
+
+    summary = session_summaries[session_id]
+    summary["num_interactions"] = len(session.interactions)
+    summary["num_selections"] = session.num_selections
+
+    # Notificar solo lo que cambió (el grafo se materializa solo si hay clientes)
+    if metrics_subscribers.get(session_id):
+        _publish(session_id, {
+            "from_node": interaction.from_node,
+            "to_node": interaction.to_node,
+            "weight": analyzer.graph[interaction.from_node][interaction.to_node]['weight'],
+            "timestamp": interaction.timestamp,
+            "num_interactions": len(session.interactions),
+            "num_nodes": analyzer.graph.number_of_nodes(),
+            "num_edges": analyzer.graph.number_of_edges()
+        })
+
     return {
         "message": "Interacción agregada exitosamente",
         "num_interactions": len(session.interactions)
@@ -124,12 +219,17 @@ async def add_interaction(
 
 
 @app.get("/api/sessions/{session_id}/metrics")
-async def get_session_metrics(session_id: str) -> GraphMetrics:
+async def get_session_metrics(session_id: str, include: Optional[str] = None) -> GraphMetrics:
     """
     Obtiene las métricas del grafo para una sesión
 
+    Las métricas se recalculan solo si la sesión recibió nuevas
+    interacciones desde el último cálculo.
+
     Args:
         session_id: ID de la sesión
+        include: Grupos de métricas separados por comas
+            (p. ej. "topology,diffusion"); por defecto todos salvo diffusion
 
     Returns:
         GraphMetrics con todas las métricas calculadas
@@ -140,21 +240,104 @@ async def get_session_metrics(session_id: str) -> GraphMetrics:
             detail=f"Sesión {session_id} no encontrada"
         )
 
+    session = sessions_db.touch(session_id)
     analyzer = analyzers_db[session_id]
 
-    try:
-        metrics = analyzer.compute_all_metrics()
+    if include is None:
+        groups = DEFAULT_METRIC_GROUPS
+    else:
+        groups = frozenset(g.strip() for g in include.split(",") if g.strip())
+
+    # Un solo cálculo concurrente por sesión
+    async with metrics_locks[session_id]:
+        version = (len(session.interactions), groups)
+        cached = metrics_cache.get(session_id)
+
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        try:
+            metrics = await analyzer.compute_all_metrics_async(include=groups)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # La sesión pudo eliminarse o desalojarse durante el cálculo: no
+        # recrear una entrada de caché que ya nadie liberaría
+        if session_id in sessions_db:
+            metrics_cache[session_id] = (version, metrics)
 
         # Guardar métricas en sesión
-        sessions_db[session_id].graph_metrics = metrics
+        session.graph_metrics = metrics
 
         return metrics
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+
+async def _wait_disconnect(websocket: WebSocket):
+    """Descarta los mensajes del cliente hasta que se desconecta"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@app.websocket("/api/sessions/{session_id}/metrics/stream")
+async def stream_session_metrics(websocket: WebSocket, session_id: str):
+    """
+    Envía en tiempo real los cambios del grafo de una sesión
+
+    Cada interacción agregada produce un mensaje con la arista afectada
+    y los contadores del grafo, en lugar de las métricas completas.
+
+    Args:
+        websocket: Conexión WebSocket
+        session_id: ID de la sesión
+    """
+    if session_id not in sessions_db:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    metrics_subscribers.setdefault(session_id, []).append(queue)
+
+    # Leer del socket en paralelo: sin esto una desconexión solo se
+    # detectaría en el siguiente send_text (nunca, si la sesión está inactiva)
+    disconnected = asyncio.ensure_future(_wait_disconnect(websocket))
+
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait(
+                {getter, disconnected},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not getter.done():
+                # Cliente desconectado
+                getter.cancel()
+                break
+
+            delta = getter.result()
+
+            if delta is None:
+                # Sesión eliminada
+                await websocket.close()
+                break
+
+            await websocket.send_text(orjson.dumps(delta).decode())
+
+    except WebSocketDisconnect:
+        pass
+
+    finally:
+        disconnected.cancel()
+        subscribers = metrics_subscribers.get(session_id)
+        if subscribers and queue in subscribers:
+            subscribers.remove(queue)
 
 
 @app.get("/api/sessions/{session_id}")
@@ -174,7 +357,7 @@ async def get_session(session_id: str) -> Session:
             detail=f"Sesión {session_id} no encontrada"
         )
 
-    return sessions_db[session_id]
+    return sessions_db.touch(session_id)
 
 
 @app.get("/api/sessions")
@@ -185,19 +368,7 @@ async def list_sessions() -> List[Dict]:
     Returns:
         Lista de sesiones con información resumida
     """
-    sessions_list = []
-
-    for session_id, session in sessions_db.items():
-        sessions_list.append({
-            "session_id": session_id,
-            "start_time": session.start_time.isoformat(),
-            "end_time": session.end_time.isoformat() if session.end_time else None,
-            "num_interactions": len(session.interactions),
-            "num_selections": session.num_selections,
-            "duration_seconds": session.duration_seconds
-        })
-
-    return sessions_list
+    return list(session_summaries.values())
 
 
 @app.post("/api/sessions/{session_id}/end")
@@ -218,10 +389,14 @@ async def end_session(session_id: str, selected_message: List[str]) -> Dict:
             detail=f"Sesión {session_id} no encontrada"
         )
 
-    session = sessions_db[session_id]
+    session = sessions_db.touch(session_id)
     session.end_time = datetime.now()
     session.selected_message = selected_message
 
+    summary = session_summaries[session_id]
+    summary["end_time"] = session.end_time.isoformat()
+    summary["duration_seconds"] = session.duration_seconds
+
     return {
         "message": "Sesión finalizada exitosamente",
         "duration_seconds": session.duration_seconds
@@ -246,7 +421,7 @@ async def delete_session(session_id: str) -> Dict:
         )
 
     del sessions_db[session_id]
-    del analyzers_db[session_id]
+    _evict_session(session_id)
 
     return {
         "message": "Sesión eliminada exitosamente"
@@ -0,0 +1,52 @@
+"""
+Almacenamiento en memoria de sesiones con desalojo LRU
+"""
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class LRUSessionStore(OrderedDict):
+    """
+    Diccionario de sesiones acotado
+
+    Insertar o marcar con `touch` mueve la sesión al final; al superar
+    `max_sessions` se desaloja la sesión usada hace más tiempo. Las
+    lecturas no alteran el orden, de modo que iterar es seguro.
+    """
+
+    def __init__(self,
+                 max_sessions: int = 1024,
+                 on_evict: Optional[Callable[[str], None]] = None):
+        """
+        Inicializa el almacén
+
+        Args:
+            max_sessions: Número máximo de sesiones en memoria
+            on_evict: Callback invocado con el ID de cada sesión desalojada
+        """
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.on_evict = on_evict
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+
+        while len(self) > self.max_sessions:
+            evicted_id, _ = self.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_id)
+
+    def touch(self, key):
+        """
+        Marca una sesión como usada recientemente
+
+        Args:
+            key: ID de la sesión
+
+        Returns:
+            La sesión
+        """
+        self.move_to_end(key)
+        return super().__getitem__(key)
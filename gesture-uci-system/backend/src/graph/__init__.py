@@ -3,5 +3,6 @@ Módulo de análisis de grafos para DOCommunication
 """
 
 from .analyzer import InteractionGraphAnalyzer
+from .disjoint_set import DisjointSet
 
-__all__ = ['InteractionGraphAnalyzer']
+__all__ = ['InteractionGraphAnalyzer', 'DisjointSet']
@@ -10,13 +10,22 @@ Implementa:
 - Modelos de difusión (Independent Cascade)
 """
 
+import asyncio
+import bisect
+import heapq
+import logging
+import multiprocessing
 import networkx as nx
 import numpy as np
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict, Counter
-import community as community_louvain
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from scipy import sparse
+from typing import List, Dict, Tuple, Optional, Iterable
+from collections import defaultdict
 from datetime import datetime
 
+from .disjoint_set import DisjointSet
 from ..models.session import (
     InteractionRecord,
     GraphMetrics,
@@ -27,17 +36,316 @@ from ..models.session import (
     DiffusionMetrics
 )
 
+# scikit-network (opcional): betweenness sobre CSR en Cython
+try:
+    from sknetwork.ranking import Betweenness
+except ImportError:
+    Betweenness = None
+
+# igraph (opcional): Brandes y closeness implementados en C
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
+# Numba (opcional): compila los bucles de PageRank e Independent Cascade
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# nx-cugraph (opcional): ejecuta algoritmos de NetworkX en GPU NVIDIA.
+# Importarlo no garantiza un dispositivo CUDA utilizable: se prueba una
+# llamada mínima una sola vez al cargar el módulo
+try:
+    import nx_cugraph  # noqa: F401
+    nx.degree_centrality(nx.path_graph(2), backend="cugraph")
+    GPU_BACKEND: Optional[str] = "cugraph"
+except Exception:  # no instalado, o sin CUDA disponible
+    GPU_BACKEND = None
+
+logger = logging.getLogger(__name__)
+
+
+# Grupos de métricas que compute_all_metrics puede calcular
+METRIC_GROUPS = frozenset({
+    'topology', 'centralities', 'communities',
+    'robustness', 'transitions', 'diffusion'
+})
+
+# Por defecto se omite la difusión (simulaciones Independent Cascade)
+DEFAULT_METRIC_GROUPS = METRIC_GROUPS - {'diffusion'}
+
+# Sobre este número de nodos la betweenness se estima con k nodos fuente
+# (O(k·E) en lugar de O(V·E)); basta para ordenar los nodos críticos
+BETWEENNESS_SAMPLE_THRESHOLD = 200
+BETWEENNESS_SAMPLE_SIZE = 100
+
+
+def _nx_call(func, *args, **kwargs):
+    """
+    Ejecuta un algoritmo de NetworkX, despachándolo a la GPU si es posible
+
+    Si nx-cugraph no está disponible, no implementa el algoritmo o falla
+    en tiempo de ejecución (memoria de GPU, errores de CUDA), se usa la
+    implementación de NetworkX en CPU.
+    """
+    if GPU_BACKEND is not None:
+        try:
+            return func(*args, backend=GPU_BACKEND, **kwargs)
+        except NotImplementedError:
+            pass
+        except Exception as exc:
+            logger.warning(
+                "%s falló en el backend %s (%s); se reintenta en CPU",
+                func.__name__, GPU_BACKEND, exc
+            )
+    return func(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _metrics_executor() -> ProcessPoolExecutor:
+    """
+    Pool de procesos compartido para calcular métricas fuera del event loop
+
+    Usa "spawn": hacer fork de un proceso con hilos activos (servidor,
+    hilos de Numba) puede dejar bloqueados a los workers.
+    """
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _pagerank_kernel(indptr, indices, data, inv_strength, dangling,
+                         alpha, max_iter, tol):
+        """
+        Iteración de potencias de PageRank sobre la CSR traspuesta
+
+        Returns:
+            Tupla (PageRank por nodo, si convergió)
+        """
+        n = len(indptr) - 1
+        x = np.full(n, 1.0 / n)
+
+        for _ in range(max_iter):
+            dangling_sum = 0.0
+            for v in range(n):
+                if dangling[v]:
+                    dangling_sum += x[v]
+            base = (alpha * dangling_sum + 1.0 - alpha) / n
+
+            x_new = np.empty(n)
+            for v in prange(n):
+                acc = 0.0
+                for k in range(indptr[v], indptr[v + 1]):
+                    u = indices[k]
+                    acc += data[k] * x[u] * inv_strength[u]
+                x_new[v] = alpha * acc + base
+
+            err = np.abs(x_new - x).sum()
+            x = x_new
+            if err < n * tol:
+                return x, True
+
+        return x, False
+
+    @njit(cache=True)
+    def _cascade_kernel(indptr, indices, probs, seed, num_simulations, random_seed):
+        """
+        Simulaciones Independent Cascade (BFS por simulación) sobre una CSR
+
+        Returns:
+            Número de simulaciones en que se activó cada nodo
+        """
+        np.random.seed(random_seed)
+        n = len(indptr) - 1
+        counts = np.zeros(n, dtype=np.int64)
+        activated = np.zeros(n, dtype=np.bool_)
+        queue = np.empty(n, dtype=np.int64)
+
+        for _ in range(num_simulations):
+            activated[:] = False
+            activated[seed] = True
+            queue[0] = seed
+            head, tail = 0, 1
+
+            while head < tail:
+                u = queue[head]
+                head += 1
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if not activated[v] and np.random.random() < probs[k]:
+                        activated[v] = True
+                        queue[tail] = v
+                        tail += 1
+
+            for i in range(tail):
+                counts[queue[i]] += 1
+
+        return counts
+else:
+    _pagerank_kernel = None
+    _cascade_kernel = None
+
+
+def _pagerank_csr(adjacency: sparse.csr_matrix,
+                  alpha: float = 0.85,
+                  max_iter: int = 100,
+                  tol: float = 1e-06) -> np.ndarray:
+    """
+    PageRank por iteración de potencias sobre una matriz CSR ponderada
+
+    Misma formulación que nx.pagerank: los nodos sin aristas de salida
+    reparten su rango de forma uniforme.
+
+    Args:
+        adjacency: Matriz de adyacencia (fila = origen)
+        alpha: Factor de amortiguación
+        max_iter: Máximo de iteraciones
+        tol: Tolerancia de convergencia (por nodo)
+
+    Returns:
+        Array con el PageRank de cada nodo
+    """
+    n = adjacency.shape[0]
+    out_strength = np.asarray(adjacency.sum(axis=1), dtype=np.float64).ravel()
+    dangling = out_strength == 0
+    inv_strength = np.divide(1.0, out_strength, out=np.zeros(n), where=~dangling)
+    transposed = adjacency.T.tocsr()
+
+    if _pagerank_kernel is not None:
+        x, converged = _pagerank_kernel(
+            transposed.indptr, transposed.indices,
+            transposed.data.astype(np.float64), inv_strength, dangling,
+            alpha, max_iter, tol
+        )
+        if converged:
+            return x
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        xlast = x
+        x = alpha * (transposed @ (xlast * inv_strength))
+        x += (alpha * xlast[dangling].sum() + (1.0 - alpha)) / n
+
+        if np.abs(x - xlast).sum() < n * tol:
+            return x
+
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _eigenvector_csr(adjacency: sparse.csr_matrix,
+                     max_iter: int = 1000,
+                     tol: float = 1e-06) -> np.ndarray:
+    """
+    Eigenvector centrality (aristas entrantes, sin pesos) sobre una matriz CSR
+
+    Misma iteración que nx.eigenvector_centrality: x <- (I + A^T) x,
+    normalizado en norma L2.
+
+    Returns:
+        Array con la centralidad de cada nodo
+    """
+    n = adjacency.shape[0]
+    transposed = adjacency.T.tocsr()
+    transposed.data = np.ones_like(transposed.data, dtype=np.float64)
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        xlast = x
+        x = xlast + transposed @ xlast
+        x = x / (np.linalg.norm(x) or 1.0)
+
+        if np.abs(x - xlast).sum() < n * tol:
+            return x
+
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
 
 class InteractionGraphAnalyzer:
     """
     Analizador de grafos de interacciones
+
+    Las interacciones se acumulan como tripletas COO (origen, destino, peso)
+    en buffers contiguos; el grafo NetworkX y la matriz CSR se construyen
+    de forma diferida, en bloque, cuando se consultan.
     """
 
     def __init__(self):
         """Inicializa el analizador"""
-        self.graph: nx.DiGraph = nx.DiGraph()
+        self._reset()
+
+    def __getstate__(self) -> Dict:
+        """
+        Estado para pickle: solo buffers e interacciones
+
+        El grafo NetworkX y las matrices cacheadas se reconstruyen en
+        destino a partir de los buffers COO.
+        """
+        state = self.__dict__.copy()
+        state['_graph'] = nx.DiGraph()
+        state['_synced'] = 0
+        state['_csr'] = None
+        state['_igraph'] = None
+        return state
+
+    def _reset(self):
+        """Descarta el grafo y todas las interacciones acumuladas"""
+        self._graph: nx.DiGraph = nx.DiGraph()
         self.interactions: List[InteractionRecord] = []
 
+        # Interacciones ordenadas por timestamp (se mantienen al insertar)
+        self._sorted_interactions: List[InteractionRecord] = []
+        self._sorted_ts: List[float] = []
+
+        # Codificación de nodos a enteros (en orden de aparición)
+        self._node_index: Dict[str, int] = {}
+        self._nodes: List[str] = []
+
+        # Componentes conexas (débiles), actualizadas con cada arista
+        self._components = DisjointSet()
+
+        # Buffers COO: una entrada por interacción
+        self._src = array('i')
+        self._dst = array('i')
+        self._w = array('d')
+        self._durations = array('d')
+
+        # Entradas del buffer ya aplicadas al grafo NetworkX
+        self._synced = 0
+
+        # Adyacencia CSR e igraph cacheadas (se invalidan al modificar el grafo)
+        self._csr: Optional[Tuple[sparse.csr_matrix, List[str]]] = None
+        self._igraph = None
+
+        # Layout para visualización: (versión del grafo, posiciones)
+        self._layout: Optional[Tuple[Tuple[int, int], Dict]] = None
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """Grafo dirigido de interacciones, con todas las aristas aplicadas"""
+        if self._synced < len(self._src):
+            self._sync_graph()
+        return self._graph
+
+    def num_components(self) -> int:
+        """Número de componentes débilmente conexas (sin recorrer el grafo)"""
+        return self._components.num_components
+
+    def is_connected(self) -> bool:
+        """Indica si el grafo es débilmente conexo (sin recorrer el grafo)"""
+        return self._components.num_components == 1
+
+    def _index_node(self, node: str) -> int:
+        """Retorna el índice entero de un nodo, registrándolo si es nuevo"""
+        index = self._node_index.get(node)
+        if index is None:
+            index = self._node_index[node] = len(self._nodes)
+            self._nodes.append(node)
+            self._components.add()
+        return index
+
     def add_interaction(self, interaction: InteractionRecord):
         """
         Agrega una interacción al grafo
@@ -47,21 +355,26 @@ class InteractionGraphAnalyzer:
         """
         self.interactions.append(interaction)
 
-        # Agregar o actualizar arista
-        if self.graph.has_edge(interaction.from_node, interaction.to_node):
-            # Incrementar peso
-            self.graph[interaction.from_node][interaction.to_node]['weight'] += 1
-            self.graph[interaction.from_node][interaction.to_node]['durations'].append(
-                interaction.duration
-            )
+        # Lo habitual es recibirlas en orden: insertar solo si llega tarde
+        timestamp = interaction.timestamp
+        if not self._sorted_ts or timestamp >= self._sorted_ts[-1]:
+            self._sorted_ts.append(timestamp)
+            self._sorted_interactions.append(interaction)
         else:
-            # Crear nueva arista
-            self.graph.add_edge(
-                interaction.from_node,
-                interaction.to_node,
-                weight=1,
-                durations=[interaction.duration]
-            )
+            position = bisect.bisect_right(self._sorted_ts, timestamp)
+            self._sorted_ts.insert(position, timestamp)
+            self._sorted_interactions.insert(position, interaction)
+
+        from_index = self._index_node(interaction.from_node)
+        to_index = self._index_node(interaction.to_node)
+        self._components.union(from_index, to_index)
+
+        self._src.append(from_index)
+        self._dst.append(to_index)
+        self._w.append(1.0)
+        self._durations.append(interaction.duration)
+        self._csr = None
+        self._igraph = None
 
     def build_from_interactions(self, interactions: List[InteractionRecord]):
         """
@@ -70,98 +383,392 @@ class InteractionGraphAnalyzer:
         Args:
             interactions: Lista de registros de interacción
         """
-        self.graph.clear()
-        self.interactions = []
+        n = len(interactions)
+
+        self.build_from_arrays(
+            np.array([i.from_node for i in interactions], dtype=object),
+            np.array([i.to_node for i in interactions], dtype=object),
+            durations=np.fromiter(
+                (i.duration for i in interactions), dtype=np.float64, count=n
+            )
+        )
+        self.interactions = list(interactions)
+        self._sorted_interactions = sorted(interactions, key=lambda x: x.timestamp)
+        self._sorted_ts = [i.timestamp for i in self._sorted_interactions]
+
+    def build_from_arrays(self,
+                          src: np.ndarray,
+                          dst: np.ndarray,
+                          weight: Optional[np.ndarray] = None,
+                          durations: Optional[np.ndarray] = None):
+        """
+        Construye el grafo en bloque a partir de arrays paralelos de aristas
+
+        Las aristas repetidas se agregan antes de insertarlas, de modo que
+        NetworkX recibe una sola inserción por arista distinta.
+
+        Args:
+            src: Nodos de origen
+            dst: Nodos de destino
+            weight: Peso de cada arista (1 por defecto)
+            durations: Duración de cada interacción (opcional)
+        """
+        self._reset()
+
+        if len(src) == 0:
+            return
+
+        if weight is None:
+            weight = np.ones(len(src), dtype=np.float64)
+        if durations is None:
+            durations = np.full(len(src), np.nan)
+
+        # Codificar nodos a enteros en orden de aparición (origen, destino, ...)
+        endpoints = np.column_stack([src, dst]).ravel()
+        labels, first_seen, codes = np.unique(
+            endpoints, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first_seen)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        codes = rank[codes.ravel()].reshape(-1, 2)
+
+        self._nodes = labels[order].tolist()
+        self._node_index = {node: i for i, node in enumerate(self._nodes)}
+
+        self._components = DisjointSet(len(self._nodes))
+        for a, b in zip(codes[:, 0].tolist(), codes[:, 1].tolist()):
+            self._components.union(a, b)
+
+        self._src.frombytes(codes[:, 0].astype(np.intc).tobytes())
+        self._dst.frombytes(codes[:, 1].astype(np.intc).tobytes())
+        self._w.frombytes(np.asarray(weight, dtype=np.float64).tobytes())
+        self._durations.frombytes(np.asarray(durations, dtype=np.float64).tobytes())
+
+        self._sync_graph()
+
+    def _sync_graph(self):
+        """Aplica al grafo NetworkX las entradas pendientes del buffer COO"""
+        start = self._synced
+        n = len(self._nodes)
+
+        src = np.frombuffer(self._src, dtype=np.intc)[start:]
+        dst = np.frombuffer(self._dst, dtype=np.intc)[start:]
+        weight = np.frombuffer(self._w, dtype=np.float64)[start:]
+        durations = np.frombuffer(self._durations, dtype=np.float64)[start:]
+
+        self._graph.add_nodes_from(self._nodes[self._graph.number_of_nodes():])
+
+        # Agrupar entradas por arista
+        edge_ids = src.astype(np.int64) * n + dst
+        by_edge = np.argsort(edge_ids, kind='stable')
+        unique_ids, starts = np.unique(edge_ids[by_edge], return_index=True)
+        weights = np.add.reduceat(weight[by_edge], starts)
+
+        # Agregados de duración por arista (las duraciones NaN no cuentan)
+        durations = durations[by_edge]
+        known = ~np.isnan(durations)
+        durations = np.where(known, durations, 0.0)
+        duration_sums = np.add.reduceat(durations, starts)
+        duration_sqsums = np.add.reduceat(durations * durations, starts)
+        duration_counts = np.add.reduceat(known.astype(np.int64), starts)
+
+        for edge_id, edge_weight, d_sum, d_sqsum, d_count in zip(
+            unique_ids.tolist(), weights.tolist(), duration_sums.tolist(),
+            duration_sqsums.tolist(), duration_counts.tolist()
+        ):
+            u, v = divmod(edge_id, n)
+            u, v = self._nodes[u], self._nodes[v]
+
+            if self._graph.has_edge(u, v):
+                # Incrementar peso y agregados
+                data = self._graph[u][v]
+                data['weight'] += edge_weight
+                data['duration_sum'] += d_sum
+                data['duration_sqsum'] += d_sqsum
+                data['duration_count'] += d_count
+            else:
+                # Crear nueva arista
+                self._graph.add_edge(
+                    u, v,
+                    weight=edge_weight,
+                    duration_sum=d_sum,
+                    duration_sqsum=d_sqsum,
+                    duration_count=d_count
+                )
+
+        self._synced = len(self._src)
+
+    def _to_csr(self) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        Construye la matriz de adyacencia CSR ponderada desde el buffer COO
+
+        Returns:
+            Tupla (matriz CSR, lista de nodos en el orden de las filas)
+        """
+        if self._csr is None:
+            n = len(self._nodes)
+            adjacency = sparse.coo_matrix(
+                (
+                    np.frombuffer(self._w, dtype=np.float64),
+                    (np.frombuffer(self._src, dtype=np.intc),
+                     np.frombuffer(self._dst, dtype=np.intc))
+                ),
+                shape=(n, n)
+            ).tocsr()
+            self._csr = (adjacency, list(self._nodes))
+
+        return self._csr
+
+    def _to_igraph(self):
+        """
+        Construye el grafo igraph (dirigido, sin pesos) desde la matriz CSR
+
+        Returns:
+            igraph.Graph con el atributo "name" de cada vértice
+        """
+        if self._igraph is None:
+            adjacency, nodes = self._to_csr()
+            rows = np.repeat(np.arange(len(nodes)), np.diff(adjacency.indptr))
+            graph = igraph.Graph(
+                n=len(nodes),
+                edges=np.column_stack((rows, adjacency.indices)).tolist(),
+                directed=True
+            )
+            graph.vs["name"] = nodes
+            self._igraph = graph
+
+        return self._igraph
+
+    def _compute_pagerank(self) -> Dict[str, float]:
+        """PageRank ponderado, en GPU o sobre la matriz CSR"""
+        if GPU_BACKEND is not None:
+            return _nx_call(nx.pagerank, self.graph)
+
+        adjacency, nodes = self._to_csr()
+        scores = _pagerank_csr(adjacency)
+
+        return dict(zip(nodes, scores.tolist()))
+
+    def _compute_betweenness(self) -> Dict[str, float]:
+        """
+        Betweenness normalizada, en GPU, con igraph o con scikit-network
+
+        En grafos grandes se estima muestreando BETWEENNESS_SAMPLE_SIZE
+        nodos fuente (semilla fija, resultado reproducible).
+        """
+        n = len(self._nodes)
+        if n > BETWEENNESS_SAMPLE_THRESHOLD:
+            return _nx_call(
+                nx.betweenness_centrality,
+                self.graph,
+                k=min(BETWEENNESS_SAMPLE_SIZE, n),
+                seed=0
+            )
+
+        if GPU_BACKEND is None and igraph is not None:
+            graph = self._to_igraph()
+            scores = np.asarray(graph.betweenness(directed=True), dtype=np.float64)
+
+            # Normalizar como NetworkX para grafos dirigidos
+            if n > 2:
+                scores = scores / ((n - 1) * (n - 2))
+
+            return dict(zip(graph.vs["name"], scores.tolist()))
+
+        # scikit-network exige un grafo conexo
+        if GPU_BACKEND is not None or Betweenness is None or not self.is_connected():
+            return _nx_call(nx.betweenness_centrality, self.graph, normalized=True)
+
+        adjacency, nodes = self._to_csr()
+        scores = Betweenness().fit_predict(adjacency)
+
+        # scikit-network cuenta cada par una sola vez; normalizar como
+        # NetworkX para grafos dirigidos: 1 / ((n-1)(n-2)) por par ordenado
+        if n > 2:
+            scores = scores * 2 / ((n - 1) * (n - 2))
+
+        return dict(zip(nodes, scores.tolist()))
+
+    def _compute_closeness(self) -> Dict[str, float]:
+        """Closeness (distancias entrantes, Wasserman-Faust), con igraph si está disponible"""
+        if GPU_BACKEND is not None or igraph is None:
+            return _nx_call(nx.closeness_centrality, self.graph)
+
+        graph = self._to_igraph()
+        n = graph.vcount()
+        if n <= 1:
+            return dict.fromkeys(graph.vs["name"], 0.0)
+
+        # igraph promedia solo sobre los nodos alcanzables; escalar por la
+        # fracción alcanzable como hace NetworkX
+        closeness = np.asarray(graph.closeness(mode="in", normalized=True), dtype=np.float64)
+        reachable = np.asarray(graph.neighborhood_size(order=n, mode="in")) - 1
+        scores = np.nan_to_num(closeness) * reachable / (n - 1)
 
-        for interaction in interactions:
-            self.add_interaction(interaction)
+        return dict(zip(graph.vs["name"], scores.tolist()))
 
-    def compute_all_metrics(self) -> GraphMetrics:
+    def compute_all_metrics(self,
+                            include: Optional[Iterable[str]] = None) -> GraphMetrics:
         """
-        Calcula todas las métricas del grafo
+        Calcula las métricas del grafo
+
+        num_nodes, num_edges y density se calculan siempre; el resto se
+        agrupa en METRIC_GROUPS y los grupos no incluidos quedan en None.
+
+        Args:
+            include: Grupos de métricas a calcular
+                (por defecto DEFAULT_METRIC_GROUPS, sin difusión)
 
         Returns:
-            GraphMetrics con todas las métricas calculadas
+            GraphMetrics con las métricas calculadas
         """
+        include = DEFAULT_METRIC_GROUPS if include is None else frozenset(include)
+        unknown = include - METRIC_GROUPS
+        if unknown:
+            raise ValueError(f"Grupos de métricas desconocidos: {', '.join(sorted(unknown))}")
+
         if len(self.graph.nodes) == 0:
             raise ValueError("El grafo está vacío")
 
-        # Métricas topológicas
+        # Métricas topológicas básicas
         num_nodes = self.graph.number_of_nodes()
         num_edges = self.graph.number_of_edges()
         density = nx.density(self.graph)
 
+        # Resultados compartidos entre sub-análisis (solo los que se usan)
+        undirected = self.graph.to_undirected()
+        betweenness = None
+        partition = None
+        clustering = None
+
+        if include & {'centralities', 'robustness'}:
+            betweenness = self._compute_betweenness()
+
+        if include & {'centralities', 'communities'}:
+            communities = _nx_call(nx.community.louvain_communities, undirected, seed=0)
+            partition = {
+                node: comm_id
+                for comm_id, members in enumerate(communities)
+                for node in members
+            }
+
+        if include & {'topology', 'centralities'}:
+            clustering = nx.clustering(undirected)
+
         # Diámetro y camino promedio (solo si el grafo es conexo)
         diameter = None
         avg_path_length = None
 
-        if nx.is_weakly_connected(self.graph):
+        if include & {'topology', 'robustness'} and self.is_connected():
             try:
-                # Convertir a no dirigido para diámetro
-                undirected = self.graph.to_undirected()
-                diameter = nx.diameter(undirected)
-                avg_path_length = nx.average_shortest_path_length(undirected)
+                if 'topology' in include:
+                    diameter = nx.diameter(undirected)
+                avg_path_length = _nx_call(nx.average_shortest_path_length, undirected)
             except:
                 pass
 
-        avg_clustering = nx.average_clustering(self.graph.to_undirected())
+        metrics = {}
+
+        if 'topology' in include:
+            metrics.update(
+                diameter=diameter,
+                avg_path_length=avg_path_length,
+                avg_clustering_coefficient=sum(clustering.values()) / num_nodes
+            )
 
         # Métricas por nodo
-        node_metrics = self._compute_node_metrics()
+        if 'centralities' in include:
+            metrics['node_metrics'] = self._compute_node_metrics(
+                betweenness, partition, clustering
+            )
 
         # Comunidades
-        communities_data = self._detect_communities()
+        if 'communities' in include:
+            communities_data = self._detect_communities(undirected, partition)
+            metrics.update(
+                num_communities=communities_data['num_communities'],
+                modularity_score=communities_data['modularity'],
+                communities=communities_data['communities']
+            )
 
         # Robustez
-        robustness = self._compute_robustness()
+        if 'robustness' in include:
+            metrics['robustness'] = self._compute_robustness(
+                undirected, betweenness, avg_path_length
+            )
 
         # Transiciones
-        transitions = self._compute_transitions()
+        if 'transitions' in include:
+            metrics['transitions'] = self._compute_transitions()
 
         # Difusión
-        diffusion = self._compute_diffusion()
+        if 'diffusion' in include:
+            metrics['diffusion'] = self._compute_diffusion()
 
         return GraphMetrics(
             num_nodes=num_nodes,
             num_edges=num_edges,
             density=density,
-            diameter=diameter,
-            avg_path_length=avg_path_length,
-            avg_clustering_coefficient=avg_clustering,
-            node_metrics=node_metrics,
-            num_communities=communities_data['num_communities'],
-            modularity_score=communities_data['modularity'],
-            communities=communities_data['communities'],
-            robustness=robustness,
-            transitions=transitions,
-            diffusion=diffusion
+            **metrics
         )
 
-    def _compute_node_metrics(self) -> List[NodeMetrics]:
-        """Calcula métricas para cada nodo"""
+    async def compute_all_metrics_async(self,
+                                        include: Optional[Iterable[str]] = None,
+                                        executor: Optional[Executor] = None) -> GraphMetrics:
+        """
+        Calcula las métricas en otro proceso sin bloquear el event loop
+
+        Args:
+            include: Grupos de métricas a calcular (ver compute_all_metrics)
+            executor: Executor a usar (por defecto un pool de procesos compartido)
+
+        Returns:
+            GraphMetrics con las métricas calculadas
+        """
+        if include is not None:
+            include = frozenset(include)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor or _metrics_executor(),
+            partial(self.compute_all_metrics, include=include)
+        )
+
+    def _compute_node_metrics(self,
+                              betweenness_centrality: Dict[str, float],
+                              partition: Dict[str, int],
+                              clustering: Dict[str, float]) -> List[NodeMetrics]:
+        """
+        Calcula métricas para cada nodo
+
+        Args:
+            betweenness_centrality: Betweenness por nodo
+            partition: Comunidad asignada a cada nodo
+            clustering: Coeficiente de clustering por nodo (grafo no dirigido)
+        """
         nodes = list(self.graph.nodes())
 
         # Centralidades
         degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph)
-        closeness_centrality = nx.closeness_centrality(self.graph)
+        closeness_centrality = self._compute_closeness()
 
         # Eigenvector centrality (puede fallar en grafos dirigidos)
         try:
-            eigenvector_centrality = nx.eigenvector_centrality(
-                self.graph, max_iter=1000, tol=1e-06
-            )
+            if GPU_BACKEND is not None:
+                eigenvector_centrality = _nx_call(
+                    nx.eigenvector_centrality, self.graph, max_iter=1000, tol=1e-06
+                )
+            else:
+                adjacency, csr_nodes = self._to_csr()
+                eigenvector_centrality = dict(zip(
+                    csr_nodes, _eigenvector_csr(adjacency).tolist()
+                ))
         except:
             eigenvector_centrality = {node: 0.0 for node in nodes}
 
         # PageRank
-        pagerank = nx.pagerank(self.graph)
-
-        # Clustering coefficient
-        clustering = nx.clustering(self.graph.to_undirected())
-
-        # Comunidades (para asignar community_id)
-        partition = community_louvain.best_partition(self.graph.to_undirected())
+        pagerank = self._compute_pagerank()
 
         # Crear NodeMetrics para cada nodo
         metrics = []
@@ -179,46 +786,52 @@ class InteractionGraphAnalyzer:
 
         return metrics
 
-    def _detect_communities(self) -> Dict:
+    def _detect_communities(self,
+                            undirected: nx.Graph,
+                            partition: Dict[str, int]) -> Dict:
         """
-        Detecta comunidades usando algoritmo de Louvain
+        Resume las comunidades detectadas con el algoritmo de Louvain
+
+        Args:
+            undirected: Versión no dirigida del grafo
+            partition: Comunidad asignada a cada nodo
 
         Returns:
             Dict con num_communities, modularity, communities
         """
-        undirected = self.graph.to_undirected()
+        # Agrupar nodos por comunidad y sumar sus grados en una sola pasada
+        communities_dict = defaultdict(list)
+        degree_sums = defaultdict(int)
+        for node, degree in undirected.degree():
+            comm_id = partition[node]
+            communities_dict[comm_id].append(node)
+            degree_sums[comm_id] += degree
+
+        # Contar aristas internas y externas en una sola pasada
+        internal = defaultdict(int)
+        external = defaultdict(int)
+        for u, v in undirected.edges():
+            cu, cv = partition[u], partition[v]
+            if cu == cv:
+                internal[cu] += 1
+            else:
+                external[cu] += 1
+                external[cv] += 1
 
-        # Detectar comunidades
-        partition = community_louvain.best_partition(undirected)
+        m = undirected.number_of_edges()
 
         # Calcular modularidad
-        modularity = community_louvain.modularity(partition, undirected)
-
-        # Agrupar nodos por comunidad
-        communities_dict = defaultdict(list)
-        for node, comm_id in partition.items():
-            communities_dict[comm_id].append(node)
+        modularity = nx.community.modularity(undirected, communities_dict.values())
 
         # Crear CommunityInfo para cada comunidad
         communities = []
         for comm_id, nodes in communities_dict.items():
-            # Contar aristas internas y externas
-            internal_edges = 0
-            external_edges = 0
-
-            for u, v in undirected.edges():
-                if u in nodes and v in nodes:
-                    internal_edges += 1
-                elif u in nodes or v in nodes:
-                    external_edges += 1
+            internal_edges = internal[comm_id]
+            external_edges = external[comm_id]
 
             # Calcular contribución a modularidad
-            subgraph = undirected.subgraph(nodes)
-            m = undirected.number_of_edges()
-            e_c = subgraph.number_of_edges() / m if m > 0 else 0
-
-            degrees = [undirected.degree(n) for n in nodes]
-            a_c = sum(degrees) / (2 * m) if m > 0 else 0
+            e_c = internal_edges / m if m > 0 else 0
+            a_c = degree_sums[comm_id] / (2 * m) if m > 0 else 0
             mod_contribution = e_c - (a_c ** 2)
 
             communities.append(CommunityInfo(
@@ -236,49 +849,51 @@ class InteractionGraphAnalyzer:
             'communities': communities
         }
 
-    def _compute_robustness(self) -> RobustnessMetrics:
+    def _compute_robustness(self,
+                            undirected: nx.Graph,
+                            betweenness: Dict[str, float],
+                            avg_path_length: Optional[float]) -> RobustnessMetrics:
         """
         Calcula métricas de robustez del grafo
 
+        Args:
+            undirected: Versión no dirigida del grafo
+            betweenness: Betweenness por nodo (identifica nodos críticos)
+            avg_path_length: Camino promedio del grafo no dirigido
+                (None si no es conexo)
+
         Returns:
             RobustnessMetrics
         """
-        undirected = self.graph.to_undirected()
-
-        # Calcular betweenness para identificar nodos críticos
-        betweenness = nx.betweenness_centrality(self.graph)
-
         # Top 3 nodos críticos (mayor betweenness)
-        critical_nodes = sorted(
+        critical_nodes = heapq.nlargest(
+            3,
             betweenness.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]
+            key=lambda x: x[1]
+        )
         critical_node_ids = [node for node, _ in critical_nodes]
 
-        # Calcular camino promedio original
-        avg_path_original = None
-        if nx.is_connected(undirected):
-            avg_path_original = nx.average_shortest_path_length(undirected)
+        # Camino promedio original (ya calculado si el grafo es conexo)
+        avg_path_original = avg_path_length
 
         # Simular remoción del nodo más crítico
         avg_path_after = None
         connectivity_loss = 0.0
 
-        if critical_node_ids and nx.is_connected(undirected):
-            # Crear copia sin el nodo más crítico
-            G_copy = undirected.copy()
-            G_copy.remove_node(critical_node_ids[0])
+        if critical_node_ids and avg_path_original is not None:
+            # Vista sin el nodo más crítico (no copia el grafo)
+            remaining = nx.restricted_view(undirected, [critical_node_ids[0]], [])
+            components = list(nx.connected_components(remaining))
 
             # Calcular nueva métrica si sigue conexo
-            if nx.is_connected(G_copy):
-                avg_path_after = nx.average_shortest_path_length(G_copy)
-            else:
+            if len(components) == 1:
+                avg_path_after = _nx_call(nx.average_shortest_path_length, remaining)
+            elif components:
                 # Si se desconecta, calcular para componente más grande
-                largest_cc = max(nx.connected_components(G_copy), key=len)
-                subgraph = G_copy.subgraph(largest_cc)
+                largest_cc = max(components, key=len)
+                subgraph = remaining.subgraph(largest_cc)
                 if len(subgraph.nodes) > 1:
-                    avg_path_after = nx.average_shortest_path_length(subgraph)
+                    avg_path_after = _nx_call(nx.average_shortest_path_length, subgraph)
 
                 # Calcular pérdida de conectividad
                 connectivity_loss = 1.0 - (len(largest_cc) / len(undirected.nodes))
@@ -301,38 +916,45 @@ class InteractionGraphAnalyzer:
         Returns:
             TransitionMetrics
         """
-        # Construir matriz de transiciones
-        transition_counts = defaultdict(lambda: defaultdict(int))
-        sequence = []
-
-        # Ordenar interacciones por timestamp
-        sorted_interactions = sorted(self.interactions, key=lambda x: x.timestamp)
+        # Interacciones ya ordenadas por timestamp
+        sorted_interactions = self._sorted_interactions
+        timestamps = np.array(self._sorted_ts, dtype=np.float64)
+        node_index = self._node_index
+        num_transitions = len(sorted_interactions)
+
+        # Matriz de conteos dispersa (los duplicados se suman al pasar a CSR)
+        src = np.fromiter((node_index[i.from_node] for i in sorted_interactions),
+                          dtype=np.intp, count=num_transitions)
+        dst = np.fromiter((node_index[i.to_node] for i in sorted_interactions),
+                          dtype=np.intp, count=num_transitions)
+        n = len(self._nodes)
+        counts = sparse.coo_matrix(
+            (np.ones(num_transitions), (src, dst)), shape=(n, n)
+        ).tocsr()
+
+        # Normalizar a probabilidades por fila
+        row_totals = np.asarray(counts.sum(axis=1)).ravel()
+        probs = counts.data / np.repeat(row_totals, np.diff(counts.indptr))
 
-        for interaction in sorted_interactions:
-            transition_counts[interaction.from_node][interaction.to_node] += 1
-            sequence.append((interaction.from_node, interaction.to_node))
+        # Calcular entropía de Shannon
+        entropy = float(-(probs * np.log2(probs)).sum())
 
-        # Normalizar a probabilidades
+        # Dict-of-dict solo para el payload final
+        nodes = self._nodes
         transition_matrix = {}
-        for from_node, to_nodes in transition_counts.items():
-            total = sum(to_nodes.values())
-            transition_matrix[from_node] = {
-                to_node: count / total
-                for to_node, count in to_nodes.items()
+        for row in np.flatnonzero(np.diff(counts.indptr)).tolist():
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            transition_matrix[nodes[row]] = {
+                nodes[col]: prob
+                for col, prob in zip(counts.indices[start:end].tolist(),
+                                     probs[start:end].tolist())
             }
 
-        # Calcular entropía de Shannon
-        entropy = 0.0
-        for from_node, to_nodes in transition_matrix.items():
-            for to_node, prob in to_nodes.items():
-                if prob > 0:
-                    entropy -= prob * np.log2(prob)
-
         # Calcular burstiness
-        burstiness = self._compute_burstiness(sorted_interactions)
+        burstiness = self._compute_burstiness(timestamps)
 
         # Encontrar caminos más comunes (secuencias de 3 nodos)
-        most_common_paths = self._find_common_paths(sequence, max_length=3, top_k=5)
+        most_common_paths = self._find_common_paths(src, dst, max_length=3, top_k=5)
 
         return TransitionMetrics(
             transition_matrix=transition_matrix,
@@ -341,7 +963,7 @@ class InteractionGraphAnalyzer:
             most_common_paths=most_common_paths
         )
 
-    def _compute_burstiness(self, sorted_interactions: List[InteractionRecord]) -> float:
+    def _compute_burstiness(self, timestamps: np.ndarray) -> float:
         """
         Calcula burstiness de las interacciones
 
@@ -349,23 +971,20 @@ class InteractionGraphAnalyzer:
         donde μ = media de intervalos entre eventos
               σ = desviación estándar
 
+        Args:
+            timestamps: Timestamps de las interacciones, ordenados
+
         Returns:
             Burstiness score [-1, 1]
         """
-        if len(sorted_interactions) < 2:
+        if len(timestamps) < 2:
             return 0.0
 
         # Calcular intervalos entre interacciones
-        intervals = []
-        for i in range(1, len(sorted_interactions)):
-            interval = sorted_interactions[i].timestamp - sorted_interactions[i-1].timestamp
-            intervals.append(interval)
-
-        if not intervals:
-            return 0.0
+        intervals = np.diff(timestamps)
 
-        mean = np.mean(intervals)
-        std = np.std(intervals)
+        mean = intervals.mean()
+        std = intervals.std()
 
         if mean + std == 0:
             return 0.0
@@ -373,40 +992,41 @@ class InteractionGraphAnalyzer:
         burstiness = (std - mean) / (std + mean)
         return burstiness
 
-    def _find_common_paths(self, sequence: List[Tuple[str, str]],
+    def _find_common_paths(self, src: np.ndarray, dst: np.ndarray,
                           max_length: int = 3,
                           top_k: int = 5) -> List[List[str]]:
         """
         Encuentra los caminos más comunes en la secuencia
 
+        Cada camino parte del origen de una transición y sigue los destinos
+        de las max_length - 1 transiciones siguientes.
+
         Args:
-            sequence: Lista de transiciones (from, to)
+            src: Índices de nodo origen de cada transición (en orden temporal)
+            dst: Índices de nodo destino de cada transición
             max_length: Longitud máxima del camino
             top_k: Número de caminos a retornar
 
         Returns:
             Lista de caminos más frecuentes
         """
-        if len(sequence) < max_length - 1:
+        if len(src) < max_length - 1:
             return []
 
-        # Construir caminos
-        paths = []
-        for i in range(len(sequence) - max_length + 2):
-            path = [sequence[i][0]]
-            for j in range(max_length - 1):
-                if i + j < len(sequence):
-                    path.append(sequence[i + j][1])
-
-            if len(path) == max_length:
-                paths.append(tuple(path))
+        # Ventanas deslizantes sobre los destinos, precedidas por el origen
+        windows = np.lib.stride_tricks.sliding_window_view(dst, max_length - 1)
+        paths = np.ascontiguousarray(
+            np.column_stack((src[:len(windows)], windows)), dtype=np.int64
+        )
 
-        # Contar frecuencias
-        path_counts = Counter(paths)
+        # Contar frecuencias (cada fila se trata como una clave opaca)
+        keys = paths.view(np.dtype((np.void, paths.itemsize * max_length))).ravel()
+        _, first_seen, path_counts = np.unique(keys, return_index=True, return_counts=True)
 
-        # Retornar top K
-        most_common = path_counts.most_common(top_k)
-        return [list(path) for path, _ in most_common]
+        # Retornar top K (empates por orden de aparición, como Counter)
+        top = np.lexsort((first_seen, -path_counts))[:top_k]
+        nodes = self._nodes
+        return [[nodes[i] for i in paths[first_seen[j]].tolist()] for j in top.tolist()]
 
     def _compute_diffusion(self) -> DiffusionMetrics:
         """
@@ -423,24 +1043,30 @@ class InteractionGraphAnalyzer:
         activation_threshold = 0.3
 
         nodes = list(self.graph.nodes())
+        rng = np.random.default_rng()
+
+        # Aristas y probabilidades se preparan una sola vez para todas las semillas
+        edges = self._cascade_edges(activation_threshold)
 
         for seed_node in nodes:
             # Simular diffusion desde este nodo
             activated = self._simulate_independent_cascade(
                 seed_node,
                 activation_threshold,
-                num_simulations=100
+                num_simulations=100,
+                rng=rng,
+                edges=edges
             )
 
             spread_potential[seed_node] = len(activated) / len(nodes)
             cascade_sizes[seed_node] = len(activated)
 
         # Encontrar influence maximizers (top 3)
-        influence_maximizers = sorted(
+        influence_maximizers = heapq.nlargest(
+            3,
             spread_potential.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]
+            key=lambda x: x[1]
+        )
         influence_maximizer_ids = [node for node, _ in influence_maximizers]
 
         return DiffusionMetrics(
@@ -450,10 +1076,36 @@ class InteractionGraphAnalyzer:
             influence_maximizers=influence_maximizer_ids
         )
 
+    def _cascade_edges(self, threshold: float) -> Tuple[np.ndarray, np.ndarray, sparse.csc_matrix]:
+        """
+        Prepara las aristas para simular Independent Cascade
+
+        Args:
+            threshold: Umbral de activación
+
+        Returns:
+            Tupla (origen de cada arista, probabilidad de activación basada
+            en peso, matriz (n x nnz) que acumula cada arista en su destino)
+        """
+        adjacency, nodes = self._to_csr()
+        n = len(nodes)
+        nnz = adjacency.nnz
+
+        sources = np.repeat(np.arange(n), np.diff(adjacency.indptr))
+        probs = np.minimum(adjacency.data * 0.1, threshold)
+        targets = sparse.csc_matrix(
+            (np.ones(nnz, dtype=np.float32), (adjacency.indices, np.arange(nnz))),
+            shape=(n, nnz)
+        )
+
+        return sources, probs, targets
+
     def _simulate_independent_cascade(self,
                                      seed_node: str,
                                      threshold: float,
-                                     num_simulations: int = 100) -> set:
+                                     num_simulations: int = 100,
+                                     rng: Optional[np.random.Generator] = None,
+                                     edges: Optional[Tuple] = None) -> set:
         """
         Simula modelo Independent Cascade
 
@@ -461,63 +1113,102 @@ class InteractionGraphAnalyzer:
             seed_node: Nodo inicial
             threshold: Umbral de activación
             num_simulations: Número de simulaciones
+            rng: Generador aleatorio (uno nuevo si no se indica)
+            edges: Resultado de _cascade_edges(threshold), si ya se calculó
 
         Returns:
             Set de nodos activados (promedio de simulaciones)
         """
-        total_activated = []
-
-        for _ in range(num_simulations):
-            activated = {seed_node}
-            new_active = {seed_node}
-
-            while new_active:
-                next_wave = set()
-
-                for node in new_active:
-                    # Intentar activar vecinos
-                    for neighbor in self.graph.neighbors(node):
-                        if neighbor not in activated:
-                            # Probabilidad de activación basada en peso
-                            weight = self.graph[node][neighbor].get('weight', 1)
-                            activation_prob = min(weight * 0.1, threshold)
+        nodes = self._nodes
+        n = len(nodes)
+        rng = rng if rng is not None else np.random.default_rng()
+        sources, probs, targets = edges if edges is not None else self._cascade_edges(threshold)
+
+        if _cascade_kernel is not None:
+            adjacency, _ = self._to_csr()
+            node_activation_counts = _cascade_kernel(
+                adjacency.indptr, adjacency.indices, probs,
+                self._node_index[seed_node], num_simulations,
+                int(rng.integers(2 ** 31))
+            )
+            return {
+                nodes[i] for i in np.flatnonzero(
+                    node_activation_counts >= num_simulations * 0.5
+                )
+            }
 
-                            if np.random.random() < activation_prob:
-                                next_wave.add(neighbor)
-                                activated.add(neighbor)
+        # Todas las simulaciones avanzan a la vez, una ola por iteración
+        activated = np.zeros((num_simulations, n), dtype=bool)
+        activated[:, self._node_index[seed_node]] = True
+        new_active = activated.copy()
+        draws = np.empty(num_simulations * len(sources))
 
-                new_active = next_wave
+        while new_active.any():
+            # Solo se sortean las aristas que salen de algún nodo recién activado
+            frontier = np.flatnonzero(new_active.any(axis=0)[sources])
+            wave_draws = draws[:num_simulations * len(frontier)].reshape(num_simulations, -1)
+            rng.random(out=wave_draws)
 
-            total_activated.append(activated)
+            fired = new_active[:, sources[frontier]] & (wave_draws < probs[frontier])
 
-        # Retornar nodos activados en la mayoría de simulaciones
-        node_activation_counts = defaultdict(int)
-        for activated_set in total_activated:
-            for node in activated_set:
-                node_activation_counts[node] += 1
+            reached = (targets[:, frontier] @ fired.T.astype(np.float32)).T > 0
+            new_active = reached & ~activated
+            activated |= new_active
 
         # Nodos activados en al menos 50% de simulaciones
+        node_activation_counts = activated.sum(axis=0)
         consensus_activated = {
-            node for node, count in node_activation_counts.items()
-            if count >= num_simulations * 0.5
+            nodes[i] for i in np.flatnonzero(
+                node_activation_counts >= num_simulations * 0.5
+            )
         }
 
         return consensus_activated
 
-    def visualize_graph(self, output_path: str = "graph_visualization.png"):
+    def compute_layout(self) -> Dict[str, np.ndarray]:
+        """
+        Calcula (o reutiliza) las posiciones de los nodos para visualizar
+
+        Usa Kamada-Kawai (SciPy) en lugar de spring_layout; el resultado se
+        cachea mientras el grafo no reciba nuevas interacciones.
+
+        Returns:
+            Dict nodo -> posición (x, y)
+        """
+        version = (len(self._src), len(self._nodes))
+        if self._layout is None or self._layout[0] != version:
+            self._layout = (version, nx.kamada_kawai_layout(self.graph))
+
+        return self._layout[1]
+
+    def visualize_graph(self,
+                        output_path: str = "graph_visualization.png",
+                        dpi: int = 100):
         """
         Visualiza el grafo
 
         Args:
             output_path: Ruta donde guardar la imagen
+            dpi: Resolución de la imagen
+        """
+        self.render(self.compute_layout(), output_path, dpi=dpi)
+
+    def render(self,
+               pos: Dict[str, np.ndarray],
+               output_path: str = "graph_visualization.png",
+               dpi: int = 100):
+        """
+        Dibuja el grafo con un layout ya calculado
+
+        Args:
+            pos: Posiciones de los nodos (ver compute_layout)
+            output_path: Ruta donde guardar la imagen
+            dpi: Resolución de la imagen
         """
         import matplotlib.pyplot as plt
 
         plt.figure(figsize=(12, 10))
 
-        # Layout
-        pos = nx.spring_layout(self.graph, k=1, iterations=50)
-
         # Dibujar nodos
         nx.draw_networkx_nodes(
             self.graph,
@@ -553,7 +1244,7 @@ class InteractionGraphAnalyzer:
         plt.title("Grafo de Interacciones - DOCommunication", fontsize=16)
         plt.axis('off')
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
         plt.close()
 
         print(f"Grafo visualizado en: {output_path}")
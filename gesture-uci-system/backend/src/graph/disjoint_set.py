@@ -0,0 +1,61 @@
+"""
+Conjuntos disjuntos (union-find) para seguir la conectividad del grafo
+
+Permite saber si el grafo es (débilmente) conexo sin recorrerlo: cada
+arista nueva une las componentes de sus extremos en O(α(n)).
+"""
+
+from typing import List
+
+
+class DisjointSet:
+    """Union-find sobre índices enteros 0..n-1, con unión por tamaño"""
+
+    def __init__(self, n: int = 0):
+        """
+        Inicializa n elementos, cada uno en su propia componente
+
+        Args:
+            n: Número inicial de elementos
+        """
+        self._parent: List[int] = list(range(n))
+        self._size: List[int] = [1] * n
+        self.num_components = n
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add(self) -> int:
+        """Agrega un elemento aislado y retorna su índice"""
+        index = len(self._parent)
+        self._parent.append(index)
+        self._size.append(1)
+        self.num_components += 1
+        return index
+
+    def find(self, x: int) -> int:
+        """Retorna el representante de la componente de x (con path halving)"""
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Une las componentes de a y b
+
+        Returns:
+            True si estaban separadas
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        self.num_components -= 1
+        return True
@@ -2,19 +2,33 @@
 Modelos de datos para sesiones de interacción y grafos
 """
 
+import sys
 from datetime import datetime
 from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class InteractionRecord(BaseModel):
-    """Registro de una interacción individual"""
+    """
+    Registro de una interacción individual
+
+    Inmutable: los registros generados internamente pueden crearse con
+    InteractionRecord.model_construct(...) sin pasar por la validación.
+    """
+    model_config = ConfigDict(frozen=True)
+
     from_node: str
     to_node: str
     timestamp: float
     duration: float  # duración de la selección en segundos
     session_id: str
 
+    @field_validator("from_node", "to_node")
+    @classmethod
+    def _intern_node(cls, value: str) -> str:
+        """Los IDs de nodo se repiten mucho: compartir una sola copia de cada string"""
+        return sys.intern(value)
+
 
 class NodeMetrics(BaseModel):
     """Métricas para un nodo individual"""
@@ -64,31 +78,31 @@ class DiffusionMetrics(BaseModel):
 
 
 class GraphMetrics(BaseModel):
-    """Métricas completas del grafo de interacciones"""
+    """Métricas del grafo de interacciones (None en los grupos no calculados)"""
     # Métricas topológicas generales
     num_nodes: int
     num_edges: int
     density: float
-    diameter: Optional[int]
-    avg_path_length: Optional[float]
-    avg_clustering_coefficient: float
+    diameter: Optional[int] = None
+    avg_path_length: Optional[float] = None
+    avg_clustering_coefficient: Optional[float] = None
 
     # Métricas por nodo
-    node_metrics: List[NodeMetrics]
+    node_metrics: Optional[List[NodeMetrics]] = None
 
     # Detección de comunidades
-    num_communities: int
-    modularity_score: float
-    communities: List[CommunityInfo]
+    num_communities: Optional[int] = None
+    modularity_score: Optional[float] = None
+    communities: Optional[List[CommunityInfo]] = None
 
     # Robustez
-    robustness: RobustnessMetrics
+    robustness: Optional[RobustnessMetrics] = None
 
     # Transiciones
-    transitions: TransitionMetrics
+    transitions: Optional[TransitionMetrics] = None
 
     # Difusión
-    diffusion: DiffusionMetrics
+    diffusion: Optional[DiffusionMetrics] = None
 
     # Metadata
     computed_at: datetime = Field(default_factory=datetime.now)
@@ -103,6 +117,16 @@ class Session(BaseModel):
     selected_message: List[str] = []
     graph_metrics: Optional[GraphMetrics] = None
 
+    # start_time formateado en ISO 8601 (se calcula una sola vez)
+    _start_time_iso: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def start_time_iso(self) -> str:
+        """Fecha de inicio en formato ISO 8601"""
+        if self._start_time_iso is None:
+            self._start_time_iso = self.start_time.isoformat()
+        return self._start_time_iso
+
     @property
     def duration_seconds(self) -> Optional[float]:
         """Duración de la sesión en segundos"""
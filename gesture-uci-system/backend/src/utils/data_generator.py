@@ -4,7 +4,10 @@ Generador de datos simulados para testing y demostración
 
 import random
 import time
-from typing import List
+from typing import Any, Dict, List
+
+import numpy as np
+
 from ..models.session import InteractionRecord
 
 
@@ -17,6 +20,43 @@ class DataGenerator:
         "GRACIAS", "FAMILIA", "DORMIR", "MEDICAMENTO", "BAÑO"
     ]
 
+    @classmethod
+    def generate_random_columns(
+        cls,
+        num_interactions: int = 50,
+        session_id: str = "test_session"
+    ) -> Dict[str, Any]:
+        """
+        Genera interacciones aleatorias en formato columnar
+
+        Todas las columnas se muestrean en bloque con NumPy.
+
+        Args:
+            num_interactions: Número de interacciones a generar
+            session_id: ID de la sesión
+
+        Returns:
+            Dict con el mismo formato que to_columns()
+        """
+        rng = np.random.default_rng()
+        nodes = np.array(cls.NODES, dtype=object)
+
+        # Seleccionar nodos aleatorios; el destino se muestrea entre los
+        # n-1 nodos restantes y se desplaza para saltar el origen
+        from_idx = rng.integers(0, len(nodes), size=num_interactions)
+        to_idx = rng.integers(0, len(nodes) - 1, size=num_interactions)
+        to_idx += to_idx >= from_idx
+
+        return {
+            "from_node": nodes[from_idx].tolist(),
+            "to_node": nodes[to_idx].tolist(),
+            # 2 segundos entre interacciones
+            "timestamp": time.time() + 2.0 * np.arange(num_interactions),
+            # Duración aleatoria (1-5 segundos)
+            "duration": rng.uniform(1.0, 5.0, size=num_interactions),
+            "session_id": [session_id] * num_interactions
+        }
+
     @classmethod
     def generate_random_interactions(
         cls,
@@ -33,32 +73,23 @@ class DataGenerator:
         Returns:
             Lista de InteractionRecord
         """
-        interactions = []
-        timestamp = time.time()
+        columns = cls.generate_random_columns(num_interactions, session_id)
 
-        for i in range(num_interactions):
-            # Seleccionar nodos aleatorios
-            from_node = random.choice(cls.NODES)
-            to_node = random.choice(cls.NODES)
-
-            # Evitar auto-loops
-            while to_node == from_node:
-                to_node = random.choice(cls.NODES)
-
-            # Duración aleatoria (1-5 segundos)
-            duration = random.uniform(1.0, 5.0)
-
-            interaction = InteractionRecord(
+        return [
+            InteractionRecord.model_construct(
                 from_node=from_node,
                 to_node=to_node,
-                timestamp=timestamp + i * 2.0,  # 2 segundos entre interacciones
+                timestamp=timestamp,
                 duration=duration,
                 session_id=session_id
             )
-
-            interactions.append(interaction)
-
-        return interactions
+            for from_node, to_node, timestamp, duration in zip(
+                columns["from_node"],
+                columns["to_node"],
+                columns["timestamp"].tolist(),
+                columns["duration"].tolist()
+            )
+        ]
 
     @classmethod
     def generate_realistic_sequence(
@@ -87,7 +118,7 @@ class DataGenerator:
 
         for sequence in sequences:
             for i in range(len(sequence) - 1):
-                interaction = InteractionRecord(
+                interaction = InteractionRecord.model_construct(
                     from_node=sequence[i],
                     to_node=sequence[i + 1],
                     timestamp=timestamp,
@@ -132,7 +163,7 @@ class DataGenerator:
                 while to_node == from_node:
                     to_node = random.choice(community)
 
-                interaction = InteractionRecord(
+                interaction = InteractionRecord.model_construct(
                     from_node=from_node,
                     to_node=to_node,
                     timestamp=timestamp,
@@ -153,7 +184,7 @@ class DataGenerator:
             from_node = random.choice(comm1)
             to_node = random.choice(comm2)
 
-            interaction = InteractionRecord(
+            interaction = InteractionRecord.model_construct(
                 from_node=from_node,
                 to_node=to_node,
                 timestamp=timestamp,
@@ -164,3 +195,31 @@ class DataGenerator:
             timestamp += random.uniform(0.5, 2.0)
 
         return interactions
+
+    @staticmethod
+    def to_columns(interactions: List[InteractionRecord]) -> Dict[str, Any]:
+        """
+        Convierte interacciones a formato columnar (struct-of-arrays)
+
+        Las columnas numéricas se devuelven como arrays contiguos de NumPy;
+        las de texto como listas, ya que no tienen representación numérica.
+
+        Args:
+            interactions: Lista de InteractionRecord
+
+        Returns:
+            Dict con una columna por campo de InteractionRecord
+        """
+        n = len(interactions)
+
+        return {
+            "from_node": [i.from_node for i in interactions],
+            "to_node": [i.to_node for i in interactions],
+            "timestamp": np.fromiter(
+                (i.timestamp for i in interactions), dtype=np.float64, count=n
+            ),
+            "duration": np.fromiter(
+                (i.duration for i in interactions), dtype=np.float64, count=n
+            ),
+            "session_id": [i.session_id for i in interactions]
+        }
@@ -2,7 +2,19 @@
 Módulo de visión por computadora para detección de gestos
 """
 
-from .detector import GestureDetector
-from .geometry import GeometryUtils
+import importlib
 
 __all__ = ['GestureDetector', 'GeometryUtils']
+
+# Importación diferida: usar GeometryUtils no debe cargar OpenCV ni MediaPipe
+_SUBMODULES = {
+    'GestureDetector': '.detector',
+    'GeometryUtils': '.geometry',
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(_SUBMODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,33 @@ Detector de gestos usando MediaPipe
 import cv2
 import mediapipe as mp
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from mediapipe.framework.formats import landmark_pb2
+from mediapipe.tasks.python import BaseOptions
+from mediapipe.tasks.python import vision
+from pathlib import Path
 from typing import Optional, Dict, Tuple, List
-from ..models.gesture import Landmark, LandmarkData, GestureState
+from ..models.gesture import LandmarkData, GestureState
 from .geometry import GeometryUtils
 import time
 
 
+# Modelos .task de MediaPipe (ver README para descargarlos)
+MODELS_DIR = Path(__file__).resolve().parents[2] / "models"
+# model_complexity -> variante del pose landmarker (0 lite, 1 full, 2 heavy)
+POSE_MODELS = {
+    0: MODELS_DIR / "pose_landmarker_lite.task",
+    1: MODELS_DIR / "pose_landmarker_full.task",
+    2: MODELS_DIR / "pose_landmarker_heavy.task",
+}
+DEFAULT_HAND_MODEL = MODELS_DIR / "hand_landmarker.task"
+
+
+# Filas de cada mano en el array (2, 21, 3) de manos
+LEFT_HAND = 0
+RIGHT_HAND = 1
+
+
 class GestureDetector:
     """
     Detector de gestos usando MediaPipe para DOCommunication
@@ -23,146 +44,356 @@ class GestureDetector:
 
     def __init__(self,
                  min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 model_complexity: int = 0,
+                 max_num_hands: int = 2,
+                 pose_model_path: Optional[str] = None,
+                 hand_model_path: Optional[str] = None,
+                 use_gpu: bool = True,
+                 input_height: Optional[int] = 480):
         """
         Inicializa el detector de gestos
 
         Args:
             min_detection_confidence: Confianza mínima para detección
             min_tracking_confidence: Confianza mínima para tracking
+            model_complexity: Variante del modelo de pose: 0 lite, 1 full, 2 heavy.
+                Lite basta para los ángulos de hombro/codo/muñeca de la L-pose
+            max_num_hands: Número máximo de manos; con 1 el modelo de manos
+                cuesta la mitad, pero una mano puede ocultar a la otra
+            pose_model_path: Ruta al modelo pose_landmarker .task (tiene
+                prioridad sobre model_complexity)
+            hand_model_path: Ruta al modelo hand_landmarker .task
+            use_gpu: Intentar el delegate GPU (si falla se usa CPU)
+            input_height: Alto máximo del frame que se pasa a los modelos
+                (los frames más altos se reducen; None para no reducir)
         """
-        # Inicializar MediaPipe Pose
+        # Inicializar MediaPipe Pose (Tasks API, modo video)
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence,
-            model_complexity=1
+        self.pose = self._create_landmarker(
+            vision.PoseLandmarker,
+            vision.PoseLandmarkerOptions,
+            pose_model_path or POSE_MODELS[model_complexity],
+            use_gpu,
+            num_poses=1,
+            min_pose_detection_confidence=min_detection_confidence,
+            min_pose_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
         )
 
-        # Inicializar MediaPipe Hands
+        # Inicializar MediaPipe Hands (Tasks API, modo video). En VIDEO el grafo
+        # recorta la ROI a partir de los landmarks del frame anterior y solo
+        # vuelve a ejecutar el detector de palmas cuando la presencia cae por
+        # debajo de min_hand_presence_confidence: no hace falta recortar aquí
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=2,
-            min_detection_confidence=min_detection_confidence,
+        self.hands = self._create_landmarker(
+            vision.HandLandmarker,
+            vision.HandLandmarkerOptions,
+            hand_model_path or DEFAULT_HAND_MODEL,
+            use_gpu,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
 
+        # Hilo para el modelo de manos: la inferencia nativa libera el GIL, así
+        # que corre en paralelo con la de pose (que usa el hilo llamador)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hand-landmarker")
+
+        # detect_for_video exige timestamps estrictamente crecientes
+        self._last_timestamp_ms = -1
+
+        # Los modelos trabajan a 256x256 (pose) y 224x224 (manos): reducir el
+        # frame antes abarata la conversión de color y el preprocesado
+        self.input_height = input_height
+
+        # Buffers reutilizados entre frames (se dimensionan con el primer frame)
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+        self._hands_xyz = np.zeros((2, 21, 3))
+
+        # Último frame procesado y sus resultados: volver a pasar el mismo
+        # array no repite la inferencia (ni confunde al tracking de VIDEO)
+        self._last_frame: Optional[np.ndarray] = None
+        self._last_results = None
+
         # Utilidades de dibujo
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
+        # Estilos de dibujo, construidos una sola vez
+        self._pose_style = self.mp_drawing_styles.get_default_pose_landmarks_style()
+        self._hand_landmarks_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self._hand_connections_style = self.mp_drawing_styles.get_default_hand_connections_style()
+
         # Utilidades de geometría
         self.geometry = GeometryUtils()
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, LandmarkData, GestureState]:
+    @staticmethod
+    def _create_landmarker(landmarker_cls, options_cls, model_path, use_gpu: bool, **options):
+        """
+        Crea un landmarker de MediaPipe Tasks, con fallback de GPU a CPU
+
+        Args:
+            landmarker_cls: vision.PoseLandmarker o vision.HandLandmarker
+            options_cls: Clase de opciones correspondiente
+            model_path: Ruta al modelo .task
+            use_gpu: Intentar primero el delegate GPU
+            **options: Opciones específicas del landmarker
+
+        Returns:
+            Landmarker en modo VIDEO
+        """
+        delegates = [BaseOptions.Delegate.CPU]
+        if use_gpu:
+            delegates.insert(0, BaseOptions.Delegate.GPU)
+
+        for delegate in delegates:
+            try:
+                return landmarker_cls.create_from_options(options_cls(
+                    base_options=BaseOptions(
+                        model_asset_path=str(model_path),
+                        delegate=delegate
+                    ),
+                    running_mode=vision.RunningMode.VIDEO,
+                    **options
+                ))
+            except (RuntimeError, NotImplementedError):
+                # Sin EGL/GPU (p. ej. 'Service "kGpuService"...') se reintenta en CPU
+                if delegate == BaseOptions.Delegate.CPU:
+                    raise
+
+    def _next_timestamp_ms(self) -> int:
+        """Timestamp monótono en milisegundos para detect_for_video"""
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    @staticmethod
+    def _to_proto(landmarks) -> landmark_pb2.NormalizedLandmarkList:
+        """Convierte landmarks de Tasks al formato que usa drawing_utils"""
+        proto = landmark_pb2.NormalizedLandmarkList()
+        proto.landmark.extend(
+            landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z, visibility=lm.visibility or 0.0)
+            for lm in landmarks
+        )
+        return proto
+
+    def process_frame(self, frame: np.ndarray) -> Tuple[LandmarkData, GestureState]:
+        """
+        Procesa un frame y detecta gestos, sin dibujar anotaciones
+
+        Args:
+            frame: Frame de imagen (BGR)
+
+        Returns:
+            Tupla de (landmark_data, gesture_state)
+        """
+        pose_results, hand_results = self._run_models(frame)
+        return self._extract_gestures(pose_results, hand_results)
+
+    def process_frame_annotated(self, frame: np.ndarray,
+                                in_place: bool = False) -> Tuple[np.ndarray, LandmarkData, GestureState]:
         """
-        Procesa un frame y detecta gestos
+        Procesa un frame, detecta gestos y dibuja los landmarks (para UIs de depuración)
 
         Args:
             frame: Frame de imagen (BGR)
+            in_place: Dibujar directamente sobre frame en lugar de sobre una copia
+                (para llamadores que no vuelven a usar el frame original)
 
         Returns:
             Tupla de (frame_anotado, landmark_data, gesture_state)
         """
-        # Convertir BGR a RGB
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        image.flags.writeable = False
+        pose_results, hand_results = self._run_models(frame)
+
+        # Los landmarks son normalizados: se dibujan sobre el frame BGR original,
+        # a resolución completa, sin volver a convertir la imagen RGB de entrada
+        image = frame if in_place else frame.copy()
+        self._draw_landmarks(image, pose_results, hand_results)
+
+        landmark_data, gesture_state = self._extract_gestures(pose_results, hand_results)
+        return image, landmark_data, gesture_state
+
+    def _run_models(self, frame: np.ndarray):
+        """
+        Ejecuta los modelos de pose y manos sobre un frame
 
-        # Procesar pose
-        pose_results = self.pose.process(image)
+        Si frame es el mismo objeto que en la llamada anterior se reutilizan
+        sus resultados. La comparación es por identidad (se conserva una
+        referencia, así que el id no puede reciclarse): quien rellene un mismo
+        buffer con frames nuevos debe pasar arrays distintos, p. ej. frame.copy().
 
-        # Procesar manos
-        hand_results = self.hands.process(image)
+        Args:
+            frame: Frame de imagen (BGR)
+
+        Returns:
+            Tupla de (resultado de pose, resultado de manos) de MediaPipe Tasks
+        """
+        if frame is self._last_frame:
+            return self._last_results
+        original_frame = frame
+
+        # Reducir el frame; los landmarks son normalizados, así que no hay
+        # que reescalarlos
+        height, width = frame.shape[:2]
+        if self.input_height and height > self.input_height:
+            size = (round(width * self.input_height / height), self.input_height)
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            frame = cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+        # Convertir BGR a RGB en el buffer reutilizado; mp.Image copia los
+        # píxeles, así que el buffer puede sobrescribirse en el siguiente frame
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+        # El mismo mp.Image alimenta ambos modelos
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
+        timestamp_ms = self._next_timestamp_ms()
+
+        # Procesar manos en el hilo auxiliar y pose en este, en paralelo
+        hand_future = self._pool.submit(self.hands.detect_for_video, mp_image, timestamp_ms)
+        pose_results = self.pose.detect_for_video(mp_image, timestamp_ms)
+        hand_results = hand_future.result()
+
+        self._last_frame = original_frame
+        self._last_results = (pose_results, hand_results)
+        return self._last_results
+
+    def _extract_gestures(self, pose_results, hand_results) -> Tuple[LandmarkData, GestureState]:
+        """
+        Convierte los resultados de MediaPipe en landmarks y gestos
 
-        # Preparar imagen para anotaciones
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        Args:
+            pose_results: Resultado del PoseLandmarker
+            hand_results: Resultado del HandLandmarker
 
+        Returns:
+            Tupla de (landmark_data, gesture_state)
+        """
         # Extraer landmarks
         timestamp = time.time()
 
         pose_landmarks = None
+        pose_xyz = None
         left_hand_landmarks = None
         right_hand_landmarks = None
+        hands_valid = np.zeros(2, dtype=bool)
 
-        # Convertir pose landmarks
-        if pose_results.landmarks:
+        # Convertir pose landmarks; se pasan como dicts y LandmarkData los valida
+        # todos en una sola llamada, en lugar de un Landmark(...) por punto
+        if pose_results.pose_landmarks:
             pose_landmarks = [
-                Landmark(x=lm.x, y=lm.y, z=lm.z, visibility=lm.visibility)
-                for lm in pose_results.landmarks.landmark
+                {'x': lm.x, 'y': lm.y, 'z': lm.z, 'visibility': lm.visibility}
+                for lm in pose_results.pose_landmarks[0]
             ]
-
-            # Dibujar pose
-            self.mp_drawing.draw_landmarks(
-                image,
-                pose_results.landmarks,
-                self.mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=self.mp_drawing_styles.get_default_pose_landmarks_style()
-            )
+            pose_xyz = self.geometry.to_xyz_array(pose_results.pose_landmarks[0])
 
         # Convertir hand landmarks
-        if hand_results.multi_hand_landmarks and hand_results.multi_handedness:
+        if hand_results.hand_landmarks and hand_results.handedness:
             for hand_landmarks, handedness in zip(
-                hand_results.multi_hand_landmarks,
-                hand_results.multi_handedness
+                hand_results.hand_landmarks,
+                hand_results.handedness
             ):
-                # Convertir a lista de Landmark
+                # Convertir a lista de landmarks (validados junto con LandmarkData)
                 landmarks_list = [
-                    Landmark(x=lm.x, y=lm.y, z=lm.z)
-                    for lm in hand_landmarks.landmark
+                    {'x': lm.x, 'y': lm.y, 'z': lm.z}
+                    for lm in hand_landmarks
                 ]
 
                 # Determinar si es mano izquierda o derecha
-                label = handedness.classification[0].label
+                label = handedness[0].category_name
 
                 if label == 'Right':  # Right en la imagen = mano derecha real
                     right_hand_landmarks = landmarks_list
+                    row = RIGHT_HAND
                 else:
                     left_hand_landmarks = landmarks_list
+                    row = LEFT_HAND
 
-                # Dibujar mano
-                self.mp_drawing.draw_landmarks(
-                    image,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
+                self._hands_xyz[row] = self.geometry.to_xyz_array(hand_landmarks)
+                hands_valid[row] = True
 
         # Crear LandmarkData
-        landmark_data = LandmarkData(
-            pose_landmarks=pose_landmarks,
-            left_hand_landmarks=left_hand_landmarks,
-            right_hand_landmarks=right_hand_landmarks,
-            timestamp=timestamp
-        )
+        landmark_data = LandmarkData.model_validate({
+            'pose_landmarks': pose_landmarks,
+            'left_hand_landmarks': left_hand_landmarks,
+            'right_hand_landmarks': right_hand_landmarks,
+            'timestamp': timestamp
+        })
 
         # Detectar gestos
-        gesture_state = self._detect_gestures(landmark_data)
+        gesture_state = self._detect_gestures(landmark_data, pose_xyz,
+                                               self._hands_xyz, hands_valid)
 
-        return image, landmark_data, gesture_state
+        return landmark_data, gesture_state
 
-    def _detect_gestures(self, landmark_data: LandmarkData) -> GestureState:
+    def _draw_landmarks(self, image: np.ndarray, pose_results, hand_results):
+        """
+        Dibuja pose y manos sobre la imagen (in-place)
+
+        Args:
+            image: Imagen BGR de destino
+            pose_results: Resultado del PoseLandmarker
+            hand_results: Resultado del HandLandmarker
+        """
+        # Dibujar pose
+        if pose_results.pose_landmarks:
+            self.mp_drawing.draw_landmarks(
+                image,
+                self._to_proto(pose_results.pose_landmarks[0]),
+                self.mp_pose.POSE_CONNECTIONS,
+                landmark_drawing_spec=self._pose_style
+            )
+
+        # Dibujar manos
+        for hand_landmarks in hand_results.hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                image,
+                self._to_proto(hand_landmarks),
+                self.mp_hands.HAND_CONNECTIONS,
+                self._hand_landmarks_style,
+                self._hand_connections_style
+            )
+
+    def _detect_gestures(self, landmark_data: LandmarkData,
+                         pose_xyz: Optional[np.ndarray] = None,
+                         hands_xyz: Optional[np.ndarray] = None,
+                         hands_valid: Optional[np.ndarray] = None) -> GestureState:
         """
         Detecta gestos a partir de landmarks
 
         Args:
             landmark_data: Datos de landmarks
+            pose_xyz: Coordenadas de pose ya empaquetadas (se calculan si faltan)
+            hands_xyz: Array (2, 21, 3) de manos [izquierda, derecha] ya empaquetado
+            hands_valid: Array bool (2,) con las filas de hands_xyz que tienen mano
 
         Returns:
             Estado de gestos detectados
         """
-        # Detectar L-pose
-        l_pose_info = {'left': False, 'right': False, 'left_angle': None,
-                       'right_angle': None, 'left_visible': False, 'right_visible': False}
-
-        if landmark_data.pose_landmarks:
-            l_pose_info = self.geometry.detect_l_pose(landmark_data.pose_landmarks)
+        if pose_xyz is None and landmark_data.pose_landmarks:
+            pose_xyz = self.geometry.to_xyz_array(landmark_data.pose_landmarks)
+
+        if hands_xyz is None:
+            hands_xyz = np.zeros((2, 21, 3))
+            hands_valid = np.zeros(2, dtype=bool)
+            for row, hand_landmarks in ((LEFT_HAND, landmark_data.left_hand_landmarks),
+                                        (RIGHT_HAND, landmark_data.right_hand_landmarks)):
+                if hand_landmarks:
+                    hands_xyz[row] = self.geometry.to_xyz_array(hand_landmarks)
+                    hands_valid[row] = True
+
+        # Detectar L-pose y thumbs up (ambas manos) en una sola pasada
+        l_pose_info, thumbs_up_per_hand = self.geometry.compute_gesture_features(
+            pose_xyz, hands_xyz, hands_valid
+        )
 
-        # Detectar thumbs up en mano derecha
-        thumbs_up = False
-        if landmark_data.right_hand_landmarks:
-            thumbs_up = self.geometry.detect_thumbs_up(landmark_data.right_hand_landmarks)
+        # El gesto de confirmación se hace con la mano derecha
+        thumbs_up = bool(thumbs_up_per_hand[RIGHT_HAND])
 
         # Crear GestureState
         gesture_state = GestureState(
@@ -200,6 +431,7 @@ class GestureDetector:
 
     def close(self):
         """Libera recursos"""
+        self._pool.shutdown(wait=True)
         self.pose.close()
         self.hands.close()
 
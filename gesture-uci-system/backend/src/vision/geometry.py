@@ -2,10 +2,145 @@
 Utilidades de geometría para detección de gestos
 """
 
+import math
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from operator import mul
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, Mapping
 from ..models.gesture import Landmark
 
+# Numba (opcional): compila la aritmética sobre vectores de 3 elementos, donde
+# domina el coste de despacho de NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _angle_deg(a: List[float], b: List[float]) -> float:
+    """Ángulo en grados entre dos vectores dados como listas de floats"""
+    d = sum(map(mul, a, b)) / ((math.hypot(*a) + 1e-8) * (math.hypot(*b) + 1e-8))
+    return math.degrees(math.acos(min(max(d, -1.0), 1.0)))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _angle_scalar(ax, ay, az, bx, by, bz):
+        """Ángulo en grados entre los vectores (ax, ay, az) y (bx, by, bz)"""
+        norm_a = math.sqrt(ax * ax + ay * ay + az * az) + 1e-8
+        norm_b = math.sqrt(bx * bx + by * by + bz * bz) + 1e-8
+        d = (ax * bx + ay * by + az * bz) / (norm_a * norm_b)
+        if d > 1.0:
+            d = 1.0
+        elif d < -1.0:
+            d = -1.0
+        return math.degrees(math.acos(d))
+
+    @njit(cache=True, fastmath=True)
+    def _angles_kernel(v1, v2):
+        """
+        Ángulo en grados entre cada par de filas de v1 y v2, arrays (k, 3)
+
+        Returns:
+            Array (k,) de ángulos
+        """
+        angles = np.empty(v1.shape[0])
+        for i in range(v1.shape[0]):
+            angles[i] = _angle_scalar(v1[i, 0], v1[i, 1], v1[i, 2],
+                                      v2[i, 0], v2[i, 1], v2[i, 2])
+        return angles
+
+    @njit(cache=True, fastmath=True)
+    def _arms_kernel(pose_xyz, arm_indices, margin):
+        """
+        Ángulo del codo y visibilidad en frame de ambos brazos, en una pasada
+
+        Args:
+            arm_indices: Filas [hombro, codo, muñeca] del brazo izquierdo y del derecho
+
+        Returns:
+            Tupla de arrays (2,): (ángulos, ángulo válido, brazo visible)
+        """
+        angles = np.zeros(2)
+        valid = np.zeros(2, dtype=np.bool_)
+        visible = np.ones(2, dtype=np.bool_)
+
+        for arm in range(2):
+            shoulder = arm_indices[3 * arm]
+            elbow = arm_indices[3 * arm + 1]
+            wrist = arm_indices[3 * arm + 2]
+
+            # Visibilidad sin saltos por punto
+            for j in range(3):
+                x = pose_xyz[arm_indices[3 * arm + j], 0]
+                y = pose_xyz[arm_indices[3 * arm + j], 1]
+                visible[arm] &= (x >= margin) & (x <= 1 - margin) & (y >= margin) & (y <= 1 - margin)
+
+            ax = pose_xyz[shoulder, 0] - pose_xyz[elbow, 0]
+            ay = pose_xyz[shoulder, 1] - pose_xyz[elbow, 1]
+            az = pose_xyz[shoulder, 2] - pose_xyz[elbow, 2]
+            bx = pose_xyz[wrist, 0] - pose_xyz[elbow, 0]
+            by = pose_xyz[wrist, 1] - pose_xyz[elbow, 1]
+            bz = pose_xyz[wrist, 2] - pose_xyz[elbow, 2]
+
+            valid[arm] = ((ax != 0.0) | (ay != 0.0) | (az != 0.0)) & ((bx != 0.0) | (by != 0.0) | (bz != 0.0))
+            angles[arm] = _angle_scalar(ax, ay, az, bx, by, bz)
+
+        return angles, valid, visible
+
+    @njit(cache=True, fastmath=True)
+    def _thumbs_up_kernel(hand_xyz, finger_tips, thumb_ip, index_mcp):
+        """
+        Thumbs up sobre un array (21, 3) de landmarks de mano
+
+        Args:
+            finger_tips: Filas de las puntas [pulgar, índice, medio, anular, meñique]
+        """
+        if not hand_xyz[finger_tips[0], 1] < hand_xyz[thumb_ip, 1]:
+            return False
+
+        squared = np.empty(len(finger_tips))
+        for i in range(len(finger_tips)):
+            tip = finger_tips[i]
+            dx = hand_xyz[tip, 0] - hand_xyz[index_mcp, 0]
+            dy = hand_xyz[tip, 1] - hand_xyz[index_mcp, 1]
+            dz = hand_xyz[tip, 2] - hand_xyz[index_mcp, 2]
+            squared[i] = dx * dx + dy * dy + dz * dz
+
+        folded_count = 0
+        for i in range(1, len(finger_tips)):
+            if squared[i] < 0.64 * squared[0]:
+                folded_count += 1
+        return folded_count >= 2
+
+    @njit(cache=True)
+    def _thumbs_up_batch_kernel(hands_xyz, valid, finger_tips, thumb_ip, index_mcp):
+        """Thumbs up por mano sobre un array (num_manos, 21, 3)"""
+        result = np.zeros(hands_xyz.shape[0], dtype=np.bool_)
+        for h in range(hands_xyz.shape[0]):
+            if valid[h]:
+                result[h] = _thumbs_up_kernel(hands_xyz[h], finger_tips, thumb_ip, index_mcp)
+        return result
+
+    @njit(cache=True)
+    def _gestures_kernel(pose_xyz, arm_indices, margin,
+                         hands_xyz, hands_valid, finger_tips, thumb_ip, index_mcp):
+        """
+        Brazos (L-pose) y thumbs up por mano en una sola llamada compilada
+
+        Returns:
+            Tupla (ángulos, ángulo válido, brazo visible, thumbs up por mano)
+        """
+        angles, valid, visible = _arms_kernel(pose_xyz, arm_indices, margin)
+        thumbs_up = _thumbs_up_batch_kernel(hands_xyz, hands_valid, finger_tips, thumb_ip, index_mcp)
+        return angles, valid, visible, thumbs_up
+else:
+    _angles_kernel = None
+    _arms_kernel = None
+    _gestures_kernel = None
+    _thumbs_up_kernel = None
+    _thumbs_up_batch_kernel = None
+
 
 class GeometryUtils:
     """Utilidades para cálculos geométricos en detección de gestos"""
@@ -13,6 +148,9 @@ class GeometryUtils:
     # Tolerancia para ángulo de L-pose (45° de tolerancia = rango 45°-135°)
     L_POSE_ANGLE_TOLERANCE = 45.0
 
+    # Margen del frame para considerar un brazo visible (5%)
+    FRAME_MARGIN = 0.05
+
     # Índices de landmarks de MediaPipe Pose (33 puntos)
     POSE_LANDMARKS = {
         'LEFT_SHOULDER': 11,
@@ -23,6 +161,22 @@ class GeometryUtils:
         'RIGHT_WRIST': 16,
     }
 
+    # Resultado de detect_l_pose sin pose detectada (compartido, de solo lectura)
+    NO_L_POSE: Mapping = MappingProxyType({
+        'left': False,
+        'right': False,
+        'left_angle': None,
+        'right_angle': None,
+        'left_visible': False,
+        'right_visible': False
+    })
+
+    # Hombro, codo y muñeca de cada brazo, en filas del array de pose
+    _ARM_INDICES = np.array([
+        POSE_LANDMARKS['LEFT_SHOULDER'], POSE_LANDMARKS['LEFT_ELBOW'], POSE_LANDMARKS['LEFT_WRIST'],
+        POSE_LANDMARKS['RIGHT_SHOULDER'], POSE_LANDMARKS['RIGHT_ELBOW'], POSE_LANDMARKS['RIGHT_WRIST'],
+    ])
+
     # Índices de landmarks de MediaPipe Hand (21 puntos)
     HAND_LANDMARKS = {
         'WRIST': 0,
@@ -35,33 +189,80 @@ class GeometryUtils:
         'PINKY_TIP': 20,
     }
 
+    # Puntas de [pulgar, índice, medio, anular, meñique], en filas del array de mano
+    _FINGER_TIPS = np.array([
+        HAND_LANDMARKS['THUMB_TIP'], HAND_LANDMARKS['INDEX_TIP'], HAND_LANDMARKS['MIDDLE_TIP'],
+        HAND_LANDMARKS['RING_TIP'], HAND_LANDMARKS['PINKY_TIP'],
+    ])
+
+    def __init__(self):
+        """Compila los kernels de Numba (si está disponible) antes del primer frame"""
+        if njit is not None:
+            self.detect_l_pose(np.zeros((33, 3)))
+            self.detect_thumbs_up(np.zeros((21, 3)))
+            self.detect_thumbs_up_batch(np.zeros((2, 21, 3)), np.zeros(2, dtype=bool))
+            self.compute_gesture_features(np.zeros((33, 3)), np.zeros((2, 21, 3)),
+                                          np.zeros(2, dtype=bool))
+
     @staticmethod
     def distance_3d(p1: Landmark, p2: Landmark) -> float:
         """Calcula distancia euclidiana 3D entre dos landmarks"""
-        return np.sqrt(
-            (p1.x - p2.x) ** 2 +
-            (p1.y - p2.y) ** 2 +
-            (p1.z - p2.z) ** 2
-        )
+        dx = p1.x - p2.x
+        dy = p1.y - p2.y
+        dz = p1.z - p2.z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     @staticmethod
-    def angle_between_vectors(v1: np.ndarray, v2: np.ndarray) -> float:
+    def to_xyz_array(landmarks) -> np.ndarray:
         """
-        Calcula el ángulo entre dos vectores en grados
+        Empaqueta landmarks en un array (n, 3) con sus coordenadas x, y, z
 
         Args:
-            v1: Vector 1 como numpy array
-            v2: Vector 2 como numpy array
+            landmarks: Secuencia de landmarks (Landmark o resultados de MediaPipe)
 
         Returns:
-            Ángulo en grados [0, 180]
+            Array float64 de forma (n, 3)
+        """
+        return np.fromiter(
+            (c for lm in landmarks for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float64,
+            count=3 * len(landmarks)
+        ).reshape(-1, 3)
+
+    @staticmethod
+    def angle_between_vectors(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
         """
-        # Normalizar vectores
-        v1_norm = v1 / (np.linalg.norm(v1) + 1e-8)
-        v2_norm = v2 / (np.linalg.norm(v2) + 1e-8)
+        Calcula el ángulo entre dos vectores en grados
+
+        Acepta vectores sueltos (3,) o lotes (k, 3); el ángulo se calcula
+        sobre el último eje.
 
-        # Calcular producto punto
-        dot_product = np.clip(np.dot(v1_norm, v2_norm), -1.0, 1.0)
+        Args:
+            v1: Vector(es) 1 como numpy array
+            v2: Vector(es) 2 como numpy array
+
+        Returns:
+            Ángulo(s) en grados [0, 180]
+        """
+        if _angles_kernel is not None:
+            if v1.ndim == 1:
+                return _angles_kernel(v1[np.newaxis], v2[np.newaxis])[0]
+            return _angles_kernel(v1, v2)
+
+        # Escalares y lotes pequeños (los dos brazos): math sobre floats de
+        # Python evita el despacho de ~10 ufuncs de NumPy
+        if v1.ndim == 1:
+            return _angle_deg(v1.tolist(), v2.tolist())
+        if len(v1) <= 8:
+            return np.array([_angle_deg(a, b) for a, b in zip(v1.tolist(), v2.tolist())])
+
+        # Normas (producto punto consigo mismo, por fila)
+        norm1 = np.sqrt(np.einsum('...i,...i->...', v1, v1)) + 1e-8
+        norm2 = np.sqrt(np.einsum('...i,...i->...', v2, v2)) + 1e-8
+
+        # Calcular producto punto normalizado (np.clip es lento en arrays pequeños)
+        dot_product = np.einsum('...i,...i->...', v1, v2) / (norm1 * norm2)
+        dot_product = np.minimum(np.maximum(dot_product, -1.0), 1.0)
 
         # Calcular ángulo en radianes y convertir a grados
         angle_rad = np.arccos(dot_product)
@@ -70,15 +271,16 @@ class GeometryUtils:
         return angle_deg
 
     @classmethod
-    def detect_l_pose(cls, pose_landmarks: List[Landmark]) -> Dict:
+    def detect_l_pose(cls, pose_xyz: np.ndarray) -> Mapping:
         """
         Detecta si los brazos están en posición de L
 
         Args:
-            pose_landmarks: Lista de 33 landmarks de pose
+            pose_xyz: Array (33, 3) con las coordenadas de los landmarks de pose
+                (ver to_xyz_array)
 
         Returns:
-            Dict con información de detección:
+            Dict con información de detección (NO_L_POSE si no hay pose):
             {
                 'left': bool,
                 'right': bool,
@@ -88,72 +290,55 @@ class GeometryUtils:
                 'right_visible': bool
             }
         """
-        if not pose_landmarks or len(pose_landmarks) < 17:
-            return {
-                'left': False,
-                'right': False,
-                'left_angle': None,
-                'right_angle': None,
-                'left_visible': False,
-                'right_visible': False
-            }
+        if pose_xyz is None or len(pose_xyz) < 17:
+            return cls.NO_L_POSE
 
-        # Extraer landmarks necesarios
-        left_shoulder = pose_landmarks[cls.POSE_LANDMARKS['LEFT_SHOULDER']]
-        left_elbow = pose_landmarks[cls.POSE_LANDMARKS['LEFT_ELBOW']]
-        left_wrist = pose_landmarks[cls.POSE_LANDMARKS['LEFT_WRIST']]
+        if _arms_kernel is not None:
+            angles, valid, visible = _arms_kernel(pose_xyz, cls._ARM_INDICES, cls.FRAME_MARGIN)
+            return cls._l_pose_result(angles.tolist(), valid.tolist(), visible.tolist())
 
-        right_shoulder = pose_landmarks[cls.POSE_LANDMARKS['RIGHT_SHOULDER']]
-        right_elbow = pose_landmarks[cls.POSE_LANDMARKS['RIGHT_ELBOW']]
-        right_wrist = pose_landmarks[cls.POSE_LANDMARKS['RIGHT_WRIST']]
+        # arm[brazo, punto] con brazo = [izquierdo, derecho]
+        # y punto = [hombro, codo, muñeca]
+        arm = pose_xyz.take(cls._ARM_INDICES, axis=0).reshape(2, 3, 3)
 
-        # Verificar visibilidad en frame (5% de margen)
-        margin = 0.05
+        # Verificar visibilidad en frame (con margen). En NumPy la comparación
+        # vectorizada sobre 2x3 puntos cuesta más que este bucle sobre floats
+        margin = cls.FRAME_MARGIN
 
-        def is_visible_in_frame(shoulder, elbow, wrist):
-            points = [shoulder, elbow, wrist]
-            for p in points:
-                if (p.x < margin or p.x > 1 - margin or
-                    p.y < margin or p.y > 1 - margin):
+        def is_visible_in_frame(points):
+            for x, y, _ in points:
+                if (x < margin or x > 1 - margin or
+                    y < margin or y > 1 - margin):
                     return False
             return True
 
-        left_visible = is_visible_in_frame(left_shoulder, left_elbow, left_wrist)
-        right_visible = is_visible_in_frame(right_shoulder, right_elbow, right_wrist)
-
-        # Calcular ángulos
-        left_angle = None
-        right_angle = None
-
-        # Brazo izquierdo
-        v1_left = np.array([
-            left_shoulder.x - left_elbow.x,
-            left_shoulder.y - left_elbow.y,
-            left_shoulder.z - left_elbow.z
-        ])
-        v2_left = np.array([
-            left_wrist.x - left_elbow.x,
-            left_wrist.y - left_elbow.y,
-            left_wrist.z - left_elbow.z
-        ])
-
-        if np.linalg.norm(v1_left) > 0 and np.linalg.norm(v2_left) > 0:
-            left_angle = cls.angle_between_vectors(v1_left, v2_left)
-
-        # Brazo derecho
-        v1_right = np.array([
-            right_shoulder.x - right_elbow.x,
-            right_shoulder.y - right_elbow.y,
-            right_shoulder.z - right_elbow.z
-        ])
-        v2_right = np.array([
-            right_wrist.x - right_elbow.x,
-            right_wrist.y - right_elbow.y,
-            right_wrist.z - right_elbow.z
-        ])
-
-        if np.linalg.norm(v1_right) > 0 and np.linalg.norm(v2_right) > 0:
-            right_angle = cls.angle_between_vectors(v1_right, v2_right)
+        left_points, right_points = arm.tolist()
+        visible = [is_visible_in_frame(left_points), is_visible_in_frame(right_points)]
+
+        # Calcular ángulos de ambos brazos en un solo lote
+        v1 = arm[:, 0] - arm[:, 1]  # hombro - codo
+        v2 = arm[:, 2] - arm[:, 1]  # muñeca - codo
+        valid = (v1.any(axis=1) & v2.any(axis=1)).tolist()
+        angles = cls.angle_between_vectors(v1, v2).tolist()
+
+        return cls._l_pose_result(angles, valid, visible)
+
+    @classmethod
+    def _l_pose_result(cls, angles: List[float], valid: List[bool], visible: List[bool]) -> Dict:
+        """
+        Arma el resultado de detect_l_pose a partir de los datos de cada brazo
+
+        Args:
+            angles: Ángulo del codo [izquierdo, derecho]
+            valid: Si cada ángulo es válido (ambos segmentos con longitud > 0)
+            visible: Si cada brazo está dentro del frame
+
+        Returns:
+            Dict con el formato de detect_l_pose
+        """
+        left_angle = angles[0] if valid[0] else None
+        right_angle = angles[1] if valid[1] else None
+        left_visible, right_visible = visible
 
         # Determinar si está en L (ángulo cercano a 90° con tolerancia de 45°)
         left_in_l = (left_angle is not None and
@@ -173,42 +358,97 @@ class GeometryUtils:
         }
 
     @classmethod
-    def detect_thumbs_up(cls, hand_landmarks: Optional[List[Landmark]]) -> bool:
+    def compute_gesture_features(cls, pose_xyz: Optional[np.ndarray], hands_xyz: np.ndarray,
+                                 hands_valid: np.ndarray) -> Tuple[Mapping, np.ndarray]:
+        """
+        Calcula L-pose y thumbs up por mano en una sola pasada
+
+        Con Numba todo se resuelve en una única llamada compilada; sin Numba
+        equivale a detect_l_pose + detect_thumbs_up_batch.
+
+        Args:
+            pose_xyz: Array (33, 3) de pose, o None si no se detectó pose
+            hands_xyz: Array (num_manos, 21, 3) de manos
+            hands_valid: Array bool (num_manos,) con las filas que tienen mano
+
+        Returns:
+            Tupla (resultado de detect_l_pose, array bool de thumbs up por mano)
+        """
+        has_pose = pose_xyz is not None and len(pose_xyz) >= 17
+
+        if _gestures_kernel is not None and has_pose:
+            angles, valid, visible, thumbs_up = _gestures_kernel(
+                pose_xyz, cls._ARM_INDICES, cls.FRAME_MARGIN,
+                hands_xyz, hands_valid, cls._FINGER_TIPS,
+                cls.HAND_LANDMARKS['THUMB_IP'], cls.HAND_LANDMARKS['INDEX_MCP']
+            )
+            return cls._l_pose_result(angles.tolist(), valid.tolist(), visible.tolist()), thumbs_up
+
+        l_pose_info = cls.detect_l_pose(pose_xyz) if has_pose else cls.NO_L_POSE
+        return l_pose_info, cls.detect_thumbs_up_batch(hands_xyz, hands_valid)
+
+    @classmethod
+    def detect_thumbs_up(cls, hand_xyz: Optional[np.ndarray]) -> bool:
         """
         Detecta gesto de pulgar arriba (👍)
 
         Args:
-            hand_landmarks: Lista de 21 landmarks de mano
+            hand_xyz: Array (21, 3) con las coordenadas de los landmarks de mano
+                (ver to_xyz_array)
 
         Returns:
             True si se detecta thumbs up
         """
-        if not hand_landmarks or len(hand_landmarks) < 21:
+        if hand_xyz is None or len(hand_xyz) < 21:
             return False
 
-        thumb_tip = hand_landmarks[cls.HAND_LANDMARKS['THUMB_TIP']]
-        thumb_ip = hand_landmarks[cls.HAND_LANDMARKS['THUMB_IP']]
-        index_tip = hand_landmarks[cls.HAND_LANDMARKS['INDEX_TIP']]
-        index_mcp = hand_landmarks[cls.HAND_LANDMARKS['INDEX_MCP']]
-        middle_tip = hand_landmarks[cls.HAND_LANDMARKS['MIDDLE_TIP']]
-        ring_tip = hand_landmarks[cls.HAND_LANDMARKS['RING_TIP']]
-        pinky_tip = hand_landmarks[cls.HAND_LANDMARKS['PINKY_TIP']]
+        if _thumbs_up_kernel is not None:
+            return _thumbs_up_kernel(hand_xyz, cls._FINGER_TIPS,
+                                     cls.HAND_LANDMARKS['THUMB_IP'],
+                                     cls.HAND_LANDMARKS['INDEX_MCP'])
 
         # 1. Pulgar extendido hacia arriba
-        thumb_extended = thumb_tip.y < thumb_ip.y
-
-        # 2. Otros dedos doblados (comparar distancias)
-        thumb_dist = cls.distance_3d(thumb_tip, index_mcp)
+        thumb_tip_y = hand_xyz[cls.HAND_LANDMARKS['THUMB_TIP'], 1]
+        thumb_ip_y = hand_xyz[cls.HAND_LANDMARKS['THUMB_IP'], 1]
+        if not thumb_tip_y < thumb_ip_y:
+            return False
 
-        index_folded = cls.distance_3d(index_tip, index_mcp) < thumb_dist * 0.8
-        middle_folded = cls.distance_3d(middle_tip, index_mcp) < thumb_dist * 0.8
-        ring_folded = cls.distance_3d(ring_tip, index_mcp) < thumb_dist * 0.8
-        pinky_folded = cls.distance_3d(pinky_tip, index_mcp) < thumb_dist * 0.8
+        # 2. Otros dedos doblados: distancias al cuadrado de [pulgar, índice,
+        # medio, anular, meñique] a la base del índice, comparadas con 0.8² = 0.64
+        tips = hand_xyz.take(cls._FINGER_TIPS, axis=0) - hand_xyz[cls.HAND_LANDMARKS['INDEX_MCP']]
+        thumb_squared, *finger_squared = np.einsum('ij,ij->i', tips, tips).tolist()
+        folded_count = sum(d < 0.64 * thumb_squared for d in finger_squared)
 
         # Al menos 2 de 4 dedos doblados
-        folded_count = sum([index_folded, middle_folded, ring_folded, pinky_folded])
+        return folded_count >= 2
+
+    @classmethod
+    def detect_thumbs_up_batch(cls, hands_xyz: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """
+        Detecta thumbs up en varias manos a la vez
+
+        Args:
+            hands_xyz: Array (num_manos, 21, 3) con los landmarks de cada mano
+            valid: Array bool (num_manos,) que indica qué filas tienen una mano
+
+        Returns:
+            Array bool (num_manos,) con el resultado por mano
+        """
+        thumb_ip = cls.HAND_LANDMARKS['THUMB_IP']
+        index_mcp = cls.HAND_LANDMARKS['INDEX_MCP']
+
+        if _thumbs_up_batch_kernel is not None:
+            return _thumbs_up_batch_kernel(hands_xyz, valid, cls._FINGER_TIPS, thumb_ip, index_mcp)
+
+        # 1. Pulgar extendido hacia arriba
+        thumb_extended = hands_xyz[:, cls.HAND_LANDMARKS['THUMB_TIP'], 1] < hands_xyz[:, thumb_ip, 1]
+
+        # 2. Al menos 2 de 4 dedos doblados (distancias al cuadrado, ver detect_thumbs_up)
+        tips = hands_xyz[:, cls._FINGER_TIPS] - hands_xyz[:, index_mcp:index_mcp + 1]
+        squared = np.einsum('hij,hij->hi', tips, tips)
+        folded_count = np.count_nonzero(squared[:, 1:] < 0.64 * squared[:, :1], axis=1)
 
-        return thumb_extended and folded_count >= 2
+        return valid & thumb_extended & (folded_count >= 2)
 
     @classmethod
     def detect_index_pointing(cls, hand_landmarks: Optional[List[Landmark]]) -> Optional[Tuple[float, float]]:
@@ -0,0 +1,144 @@
+"""
+Tests para GeometryUtils
+"""
+
+import pytest
+import sys
+import numpy as np
+from pathlib import Path
+
+# Agregar src al path
+backend_path = Path(__file__).parent.parent
+src_path = backend_path / "src"
+sys.path.insert(0, str(src_path))
+
+from src.vision import geometry
+from src.vision.geometry import GeometryUtils
+
+
+def _pose(**points):
+    """Pose (33, 3) en el centro del frame con los landmarks indicados"""
+    pose_xyz = np.full((33, 3), 0.5)
+    pose_xyz[:, 2] = 0.0
+    for name, xy in points.items():
+        pose_xyz[GeometryUtils.POSE_LANDMARKS[name], :2] = xy
+    return pose_xyz
+
+
+# Brazo izquierdo en L (90°) y brazo derecho estirado (180°)
+L_POSE = _pose(
+    LEFT_SHOULDER=(0.4, 0.3), LEFT_ELBOW=(0.4, 0.5), LEFT_WRIST=(0.6, 0.5),
+    RIGHT_SHOULDER=(0.6, 0.3), RIGHT_ELBOW=(0.6, 0.5), RIGHT_WRIST=(0.6, 0.7),
+)
+
+
+def _hand(thumb_tip_y=0.3, finger_tip=(0.52, 0.5)):
+    """Mano (21, 3) con la base del índice en (0.5, 0.5) y el pulgar hacia arriba"""
+    hand_xyz = np.zeros((21, 3))
+    hand_xyz[GeometryUtils.HAND_LANDMARKS['INDEX_MCP'], :2] = (0.5, 0.5)
+    hand_xyz[GeometryUtils.HAND_LANDMARKS['THUMB_IP'], :2] = (0.5, 0.4)
+    hand_xyz[GeometryUtils.HAND_LANDMARKS['THUMB_TIP'], :2] = (0.5, thumb_tip_y)
+    for name in ('INDEX_TIP', 'MIDDLE_TIP', 'RING_TIP', 'PINKY_TIP'):
+        hand_xyz[GeometryUtils.HAND_LANDMARKS[name], :2] = finger_tip
+    return hand_xyz
+
+
+THUMBS_UP = _hand()
+THUMB_DOWN = _hand(thumb_tip_y=0.45)
+OPEN_HAND = _hand(finger_tip=(0.5, 0.9))
+
+
+@pytest.fixture(params=["default", "fallback"])
+def geometry_path(request, monkeypatch):
+    """Ejecuta cada test con los kernels de Numba (si existen) y sin ellos"""
+    if request.param == "fallback":
+        for kernel in ('_angles_kernel', '_arms_kernel', '_gestures_kernel',
+                       '_thumbs_up_kernel', '_thumbs_up_batch_kernel'):
+            monkeypatch.setattr(geometry, kernel, None)
+    return request.param
+
+
+class TestGeometryUtils:
+    """Tests de detección de L-pose y thumbs up"""
+
+    def test_l_pose(self, geometry_path):
+        """Test L-pose en un brazo y brazo estirado en el otro"""
+        result = GeometryUtils.detect_l_pose(L_POSE)
+
+        assert result['left'] is True
+        assert result['right'] is False
+        assert result['left_angle'] == pytest.approx(90.0, abs=1e-4)
+        # acos pierde precisión cerca de -1: el brazo estirado queda a ~0.03° de 180°
+        assert result['right_angle'] == pytest.approx(180.0, abs=0.1)
+        assert result['left_visible'] is True
+        assert result['right_visible'] is True
+
+    def test_l_pose_zero_length_arm(self, geometry_path):
+        """Test brazo degenerado (muñeca sobre el codo) no tiene ángulo"""
+        pose_xyz = L_POSE.copy()
+        pose_xyz[GeometryUtils.POSE_LANDMARKS['RIGHT_WRIST']] = \
+            pose_xyz[GeometryUtils.POSE_LANDMARKS['RIGHT_ELBOW']]
+
+        result = GeometryUtils.detect_l_pose(pose_xyz)
+
+        assert result['right'] is False
+        assert result['right_angle'] is None
+        assert result['left'] is True
+
+    def test_l_pose_visibility(self, geometry_path):
+        """Test solo el brazo izquierdo exige estar dentro del frame"""
+        pose_xyz = _pose(
+            LEFT_SHOULDER=(0.02, 0.3), LEFT_ELBOW=(0.02, 0.5), LEFT_WRIST=(0.2, 0.5),
+            RIGHT_SHOULDER=(0.98, 0.3), RIGHT_ELBOW=(0.98, 0.5), RIGHT_WRIST=(0.8, 0.5),
+        )
+
+        result = GeometryUtils.detect_l_pose(pose_xyz)
+
+        assert result['left_visible'] is False
+        assert result['right_visible'] is False
+        assert result['left'] is False
+        assert result['right'] is True
+
+    def test_l_pose_without_pose(self, geometry_path):
+        """Test sin pose o con pose incompleta"""
+        assert GeometryUtils.detect_l_pose(None) == GeometryUtils.NO_L_POSE
+        assert GeometryUtils.detect_l_pose(np.zeros((16, 3))) == GeometryUtils.NO_L_POSE
+
+    def test_thumbs_up(self, geometry_path):
+        """Test thumbs up y sus casos negativos"""
+        assert GeometryUtils.detect_thumbs_up(THUMBS_UP) is True
+        assert not GeometryUtils.detect_thumbs_up(THUMB_DOWN)
+        assert not GeometryUtils.detect_thumbs_up(OPEN_HAND)
+        assert not GeometryUtils.detect_thumbs_up(None)
+
+    def test_thumbs_up_batch(self, geometry_path):
+        """Test el lote ignora las filas sin mano y coincide mano a mano"""
+        hands_xyz = np.stack([THUMBS_UP, THUMBS_UP, THUMB_DOWN, OPEN_HAND])
+        valid = np.array([True, False, True, True])
+
+        result = GeometryUtils.detect_thumbs_up_batch(hands_xyz, valid)
+
+        assert result.tolist() == [True, False, False, False]
+        for hand_xyz, is_valid, thumbs_up in zip(hands_xyz, valid, result):
+            if is_valid:
+                assert thumbs_up == GeometryUtils.detect_thumbs_up(hand_xyz)
+
+    def test_compute_gesture_features(self, geometry_path):
+        """Test la pasada combinada equivale a las detecciones por separado"""
+        hands_xyz = np.stack([THUMBS_UP, THUMBS_UP])
+        valid = np.array([True, False])
+
+        l_pose_info, thumbs_up = GeometryUtils.compute_gesture_features(L_POSE, hands_xyz, valid)
+
+        assert dict(l_pose_info) == pytest.approx(dict(GeometryUtils.detect_l_pose(L_POSE)))
+        assert thumbs_up.tolist() == [True, False]
+
+    def test_compute_gesture_features_without_pose(self, geometry_path):
+        """Test sin pose se siguen evaluando las manos"""
+        hands_xyz = np.stack([THUMB_DOWN, THUMBS_UP])
+        valid = np.array([True, True])
+
+        l_pose_info, thumbs_up = GeometryUtils.compute_gesture_features(None, hands_xyz, valid)
+
+        assert l_pose_info == GeometryUtils.NO_L_POSE
+        assert thumbs_up.tolist() == [False, True]
@@ -32,6 +32,76 @@ class TestInteractionGraphAnalyzer:
         assert analyzer_with_data.graph.number_of_edges() > 0
         assert analyzer_with_data.graph.is_directed()
 
+    def test_build_matches_incremental(self):
+        """Test construcción en bloque equivale a agregar una a una"""
+        import numpy as np
+
+        interactions = DataGenerator.generate_community_based()
+
+        bulk = InteractionGraphAnalyzer()
+        bulk.build_from_interactions(interactions)
+
+        incremental = InteractionGraphAnalyzer()
+        for i, interaction in enumerate(interactions):
+            incremental.add_interaction(interaction)
+
+            # Consultar el grafo a mitad de camino aplica las aristas pendientes
+            if i == len(interactions) // 2:
+                assert incremental.graph.number_of_nodes() > 0
+
+        assert list(bulk.graph.nodes()) == list(incremental.graph.nodes())
+        assert sorted(bulk.graph.edges()) == sorted(incremental.graph.edges())
+
+        # Los agregados de duración pueden diferir solo por redondeo
+        for u, v, data in bulk.graph.edges(data=True):
+            other = incremental.graph[u][v]
+            assert data['weight'] == other['weight']
+            assert data['duration_count'] == other['duration_count']
+            assert data['duration_sum'] == pytest.approx(other['duration_sum'])
+            assert data['duration_sqsum'] == pytest.approx(other['duration_sqsum'])
+        assert bulk.interactions == incremental.interactions
+
+        # Pesos no enteros: se agregan sin truncar, igual que sumándolos uno a uno
+        src = np.array([i.from_node for i in interactions], dtype=object)
+        dst = np.array([i.to_node for i in interactions], dtype=object)
+        weight = np.linspace(0.1, 2.5, len(interactions))
+
+        weighted = InteractionGraphAnalyzer()
+        weighted.build_from_arrays(src, dst, weight=weight)
+
+        expected = {}
+        for u, v, w in zip(src.tolist(), dst.tolist(), weight.tolist()):
+            expected[(u, v)] = expected.get((u, v), 0.0) + w
+
+        assert sorted(weighted.graph.edges()) == sorted(expected)
+        for (u, v), w in expected.items():
+            assert weighted.graph[u][v]['weight'] == pytest.approx(w)
+
+    def test_connectivity_tracking(self):
+        """Test union-find coincide con las componentes de NetworkX"""
+        import networkx as nx
+        from src.models.session import InteractionRecord
+
+        edges = [("A", "B"), ("C", "D"), ("E", "E"), ("B", "C"), ("E", "A")]
+        incremental = InteractionGraphAnalyzer()
+
+        for from_node, to_node in edges:
+            incremental.add_interaction(InteractionRecord(
+                from_node=from_node,
+                to_node=to_node,
+                timestamp=1.0,
+                duration=1.0,
+                session_id="test"
+            ))
+            expected = nx.number_weakly_connected_components(incremental.graph)
+            assert incremental.num_components() == expected
+            assert incremental.is_connected() == (expected == 1)
+
+        bulk = InteractionGraphAnalyzer()
+        bulk.build_from_interactions(incremental.interactions)
+        assert bulk.num_components() == 1
+        assert bulk.is_connected()
+
     def test_compute_all_metrics(self, analyzer_with_data):
         """Test cálculo de métricas"""
         metrics = analyzer_with_data.compute_all_metrics()
@@ -63,6 +133,15 @@ class TestInteractionGraphAnalyzer:
 
         assert len(all_community_nodes) == metrics.num_nodes
 
+        # community_id por nodo proviene de la misma partición
+        node_to_community = {
+            node: community.community_id
+            for community in metrics.communities
+            for node in community.nodes
+        }
+        for node_metric in metrics.node_metrics:
+            assert node_metric.community_id == node_to_community[node_metric.node_id]
+
     def test_robustness_metrics(self, analyzer_with_data):
         """Test métricas de robustez"""
         metrics = analyzer_with_data.compute_all_metrics()
@@ -81,7 +160,7 @@ class TestInteractionGraphAnalyzer:
 
     def test_diffusion_metrics(self, analyzer_with_data):
         """Test métricas de difusión"""
-        metrics = analyzer_with_data.compute_all_metrics()
+        metrics = analyzer_with_data.compute_all_metrics(include={'diffusion'})
 
         assert 0 < metrics.diffusion.activation_threshold < 1
         assert len(metrics.diffusion.influence_maximizers) > 0
@@ -91,6 +170,85 @@ class TestInteractionGraphAnalyzer:
             assert node in metrics.diffusion.spread_potential
             assert 0 <= metrics.diffusion.spread_potential[node] <= 1
 
+    def test_include_metric_groups(self, analyzer_with_data):
+        """Test solo se calculan los grupos de métricas solicitados"""
+        metrics = analyzer_with_data.compute_all_metrics()
+        assert metrics.diffusion is None
+        assert metrics.node_metrics is not None
+        assert metrics.transitions is not None
+
+        metrics = analyzer_with_data.compute_all_metrics(include={'topology'})
+        assert metrics.avg_clustering_coefficient is not None
+        assert metrics.node_metrics is None
+        assert metrics.communities is None
+        assert metrics.robustness is None
+
+        with pytest.raises(ValueError):
+            analyzer_with_data.compute_all_metrics(include={'unknown'})
+
+    def test_compute_all_metrics_async(self, analyzer_with_data):
+        """Test cálculo en un pool de procesos (el analizador viaja por pickle)"""
+        import asyncio
+
+        metrics = asyncio.run(
+            analyzer_with_data.compute_all_metrics_async(include={'topology'})
+        )
+
+        assert metrics.num_nodes == analyzer_with_data.graph.number_of_nodes()
+        assert metrics.num_edges == analyzer_with_data.graph.number_of_edges()
+        assert metrics.node_metrics is None
+
+    def test_centralities_match_networkx(self, analyzer_with_data):
+        """Test PageRank y betweenness coinciden con NetworkX"""
+        import networkx as nx
+
+        pagerank = analyzer_with_data._compute_pagerank()
+        betweenness = analyzer_with_data._compute_betweenness()
+
+        expected_pagerank = nx.pagerank(analyzer_with_data.graph)
+        expected_betweenness = nx.betweenness_centrality(analyzer_with_data.graph)
+
+        for node in analyzer_with_data.graph.nodes():
+            assert pagerank[node] == pytest.approx(expected_pagerank[node], abs=1e-4)
+            assert betweenness[node] == pytest.approx(expected_betweenness[node], abs=1e-6)
+
+    def test_betweenness_disconnected_graph(self):
+        """Test betweenness en un grafo con dos componentes"""
+        import networkx as nx
+        from src.models.session import InteractionRecord
+
+        edges = [("A", "B"), ("B", "C"), ("C", "A"), ("D", "E"), ("E", "F")]
+        analyzer = InteractionGraphAnalyzer()
+        analyzer.build_from_interactions([
+            InteractionRecord(
+                from_node=from_node,
+                to_node=to_node,
+                timestamp=float(i),
+                duration=1.0,
+                session_id="test"
+            )
+            for i, (from_node, to_node) in enumerate(edges)
+        ])
+        assert not analyzer.is_connected()
+
+        betweenness = analyzer._compute_betweenness()
+        expected = nx.betweenness_centrality(analyzer.graph, normalized=True)
+
+        for node in analyzer.graph.nodes():
+            assert betweenness[node] == pytest.approx(expected[node], abs=1e-9)
+
+    def test_csr_power_iteration_matches_networkx(self, analyzer_with_data):
+        """Test PageRank por iteración sobre CSR coincide con NetworkX"""
+        import networkx as nx
+        from src.graph.analyzer import _pagerank_csr
+
+        adjacency, nodes = analyzer_with_data._to_csr()
+        pagerank = dict(zip(nodes, _pagerank_csr(adjacency)))
+        expected = nx.pagerank(analyzer_with_data.graph)
+
+        for node in nodes:
+            assert pagerank[node] == pytest.approx(expected[node], abs=1e-8)
+
     def test_empty_graph(self):
         """Test con grafo vacío"""
         analyzer = InteractionGraphAnalyzer()